@@ -136,6 +136,9 @@ class PowerScopeController:
     def start_stream(self, sensor_runtime_id: int) -> None:
         self._session.start_stream(sensor_runtime_id)
 
+    def configure_stream(self, sensor_runtime_id: int, *, period_ms: int) -> None:
+        self._session.configure_stream(sensor_runtime_id, period_ms=period_ms)
+
     def stop_stream(self, sensor_runtime_id: int) -> None:
         self._session.stop_stream(sensor_runtime_id)
 
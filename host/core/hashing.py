@@ -2,16 +2,48 @@
 from __future__ import annotations
 
 import hashlib
+import mmap
+import os
+import threading
 from pathlib import Path
+from typing import Dict, Tuple
+
+# (resolved path, st_mtime_ns, st_size) -> sha256 hex digest
+_DigestKey = Tuple[str, int, int]
+_digest_cache: Dict[_DigestKey, str] = {}
+_digest_cache_lock = threading.Lock()
 
 
 def sha256_file(path: Path) -> str:
     """
-    Compute SHA256 hash of a file (streamed, memory-safe).
+    Compute SHA256 hash of a file (memory-mapped, single update).
     Returns lowercase hex digest.
+
+    Digests are memoized by (path, mtime_ns, size); a file is only re-hashed
+    when its stat changes.
     """
+    p = Path(path)
+    st = os.stat(p)
+    key: _DigestKey = (str(p.resolve()), st.st_mtime_ns, st.st_size)
+
+    with _digest_cache_lock:
+        cached = _digest_cache.get(key)
+    if cached is not None:
+        return cached
+
     h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+    with open(p, "rb") as f:
+        if st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                h.update(mm)
+    digest = h.hexdigest()
+
+    with _digest_cache_lock:
+        _digest_cache[key] = digest
+    return digest
+
+
+def clear_digest_cache() -> None:
+    """Drop all memoized file digests."""
+    with _digest_cache_lock:
+        _digest_cache.clear()
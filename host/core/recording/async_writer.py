@@ -4,9 +4,9 @@ from __future__ import annotations
 import logging
 import threading
 import time
+from collections import deque
 from pathlib import Path
-from queue import Queue, Empty
-from typing import Optional, Dict, Any, Callable, List
+from typing import Optional, Dict, Any, Callable, Deque, List
 
 
 class AsyncWriter:
@@ -28,7 +28,10 @@ class AsyncWriter:
 
         self._log = logger or logging.getLogger(__name__)
 
-        self._queue: Queue[Any] = Queue()
+        # deque.append/popleft are thread-safe; no per-item lock
+        self._queue: Deque[Any] = deque()
+        # Set by write() to wake an idle worker, and by close()
+        self._wake = threading.Event()
         self._stop_event = threading.Event()
         self._lock = threading.Lock()
 
@@ -40,7 +43,9 @@ class AsyncWriter:
         """Queue an item for writing (no-op after close())."""
         if self._stop_event.is_set():
             return
-        self._queue.put(item)
+        self._queue.append(item)
+        if not self._wake.is_set():  # plain read; set() takes a lock
+            self._wake.set()
 
     def set_path(self, new_path: Path) -> None:
         if new_path is None:
@@ -53,28 +58,40 @@ class AsyncWriter:
         if self._stop_event.is_set():
             return
         self._stop_event.set()
+        self._wake.set()
         self._thread.join(timeout=None)
 
     # ---------------- Internal ----------------
     def _worker(self) -> None:
         batch: List[Any] = []
-        last_flush = time.time()
-
-        while not self._stop_event.is_set() or not self._queue.empty():
-            try:
-                item = self._queue.get(timeout=0.1)
-                batch.append(item)
-            except Empty:
-                pass
-
-            now = time.time()
-            if batch and (now - last_flush >= self._flush_interval or self._stop_event.is_set()):
+        last_flush = time.monotonic()
+
+        queue = self._queue
+        stop = self._stop_event
+        wake = self._wake
+        while True:
+            # Drain everything queued since the last wake-up
+            while queue:
+                batch.append(queue.popleft())
+
+            stopping = stop.is_set()
+            now = time.monotonic()
+            if batch and (stopping or now - last_flush >= self._flush_interval):
                 self._flush_safe(batch)
                 batch.clear()
                 last_flush = now
 
-        if batch:
-            self._flush_safe(batch)
+            if stopping and not queue:
+                break
+
+            if batch:
+                # Rows pending: sleep out the rest of the flush interval;
+                # new rows just accumulate, close() cuts the wait short.
+                stop.wait(self._flush_interval - (now - last_flush))
+            else:
+                # Idle: sleep until write() or close()
+                wake.wait()
+                wake.clear()
 
     def _flush_safe(self, batch: List[Any]) -> None:
         """Flush with exception safety (never kill the worker thread)."""
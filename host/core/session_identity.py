@@ -14,7 +14,7 @@ def transport_fingerprint(transport: DeviceTransport) -> Dict[str, Any]:
         "type_id": int(transport.meta.type_id),
         "driver": transport.meta.driver,
         "label": transport.meta.label,
-        "params": transport.params,
+        "params": dict(transport.params),
     }
 
 
@@ -0,0 +1,46 @@
+# host/core/yaml_cache.py
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+# libyaml-backed loader when PyYAML was built with it, pure Python otherwise
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# sha256 of file bytes -> parsed document
+_doc_cache: Dict[str, Any] = {}
+_doc_cache_lock = threading.Lock()
+_MISSING = object()
+
+
+def load_yaml_file(path: Path) -> Any:
+    """
+    Parse a YAML file with the fastest available safe loader.
+
+    Parsed documents are memoized by the SHA256 of the bytes read, so an
+    unchanged file is never re-parsed. Callers get a deep copy and may
+    mutate it freely.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    with _doc_cache_lock:
+        doc = _doc_cache.get(digest, _MISSING)
+    if doc is _MISSING:
+        doc = yaml.load(raw, Loader=SafeLoader)
+        with _doc_cache_lock:
+            _doc_cache[digest] = doc
+
+    return copy.deepcopy(doc)
+
+
+def clear_yaml_cache() -> None:
+    """Drop all memoized YAML documents."""
+    with _doc_cache_lock:
+        _doc_cache.clear()
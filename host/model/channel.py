@@ -1,11 +1,13 @@
 # host/model/channel.py
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .codec import decode_primitive, primitive_size
-from .compute import eval_op
+from .codec import PrimitiveCodec, get_codec
+from .compute import OPS, eval_op
 
 
 @dataclass(frozen=True)
@@ -57,6 +59,35 @@ class Channel:
 
         self._validate()
 
+        # Resolved once; the decode path skips name normalization + lookup
+        self._codec: Optional[PrimitiveCodec] = None
+        self._st: Optional[struct.Struct] = None
+        self._size = 0
+        # Bound Struct.unpack_from for measured channels: (buf, offset) -> (raw,)
+        self.unpack_from: Optional[Callable[..., Tuple[Any, ...]]] = None
+        if self.is_measured:
+            assert self.encode is not None
+            self._codec = get_codec(self.encode)
+            self._size = self._codec.size
+            self._st = self._codec.struct_for(self.endian)
+            self.unpack_from = self._st.unpack_from
+
+        # Computed channels: compute block is validated above, resolve it once
+        self._dep_ids: Tuple[int, ...] = ()
+        self._factor = 1.0
+        self._inputs = "value"
+        self._src: Optional[Callable[[ChannelReading], Optional[float]]] = None
+        self._op_fn: Optional[Callable[[List[float]], float]] = None
+        if not self.is_measured:
+            assert self.compute is not None
+            self._dep_ids = tuple(self.compute["channels"])
+            self._factor = float(self.compute.get("factor", 1.0))
+            self._inputs = self.compute.get("inputs", "value")
+            self._src = attrgetter(self._inputs)
+            # unknown ops / empty deps keep raising from eval_op at evaluation time
+            if self._dep_ids:
+                self._op_fn = OPS.get(str(self.compute["operation"]).lower())
+
     def _validate(self) -> None:
         if self.endian not in {"little", "big"}:
             raise ValueError(f"Invalid endian '{self.endian}' for channel '{self.name}'")
@@ -67,7 +98,7 @@ class Channel:
             if self.compute is not None:
                 raise ValueError(f"Measured channel '{self.name}' must not define 'compute'")
             # validates encode exists
-            _ = primitive_size(self.encode)
+            _ = get_codec(self.encode)
         else:
             if self.encode is not None:
                 raise ValueError(f"Computed channel '{self.name}' must not define 'encode'")
@@ -108,16 +139,17 @@ class Channel:
     # --- measured ---
     @property
     def size(self) -> int:
-        if not self.is_measured:
-            return 0
-        assert self.encode is not None
-        return primitive_size(self.encode)
+        return self._size
 
     def decode_raw_bytes(self, raw_bytes: bytes) -> float:
         if not self.is_measured:
             raise RuntimeError(f"Cannot decode bytes for computed channel '{self.name}'")
-        assert self.encode is not None
-        return float(decode_primitive(self.encode, raw_bytes, endian=self.endian))
+        assert self._st is not None
+        if len(raw_bytes) != self._size:
+            raise ValueError(
+                f"Raw bytes length {len(raw_bytes)} != expected {self._size} for '{self.encode}'"
+            )
+        return float(self._st.unpack(raw_bytes)[0])
 
     def to_display_units(self, raw_value: float) -> float:
         return float(raw_value) * self.lsb * self.scale
@@ -131,27 +163,30 @@ class Channel:
         if self.is_measured:
             raise RuntimeError(f"Measured channel '{self.name}' cannot be computed")
 
-        assert self.compute is not None
-        op = str(self.compute["operation"])
-        dep_ids: List[int] = list(self.compute["channels"])
-
-        inputs = self.compute.get("inputs", "value")
-        factor = float(self.compute.get("factor", 1.0))
+        src = self._src
+        assert src is not None
+        try:
+            vals = [float(src(deps[cid])) for cid in self._dep_ids]
+        except (KeyError, TypeError):
+            self._raise_bad_deps(deps)
+            raise
+
+        op_fn = self._op_fn
+        if op_fn is None:
+            assert self.compute is not None
+            result = eval_op(str(self.compute["operation"]), vals)
+        else:
+            result = op_fn(vals)
+        return float(result * self._factor)
 
-        missing = [cid for cid in dep_ids if cid not in deps]
+    def _raise_bad_deps(self, deps: Dict[int, ChannelReading]) -> None:
+        """Slow path: explain why dependency inputs could not be collected."""
+        missing = [cid for cid in self._dep_ids if cid not in deps]
         if missing:
             raise ValueError(f"Cannot compute '{self.name}': missing deps {missing}")
-
-        vals: List[float] = []
-        for cid in dep_ids:
-            r = deps[cid]
-            src = r.value if inputs == "value" else r.raw
-            if src is None:
-                raise ValueError(f"Cannot compute '{self.name}': dep {cid} has no {inputs}")
-            vals.append(float(src))
-
-        result = eval_op(op, vals)
-        return float(result * factor)
+        for cid in self._dep_ids:
+            if getattr(deps[cid], self._inputs) is None:
+                raise ValueError(f"Cannot compute '{self.name}': dep {cid} has no {self._inputs}")
 
     def __repr__(self) -> str:
         return f"Channel(id={self.channel_id}, name='{self.name}', measured={self.is_measured})"
@@ -1,7 +1,8 @@
 # host/model/codec.py
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Tuple
 import struct
 
@@ -11,6 +12,15 @@ class PrimitiveCodec:
     fmt_le: str  # little-endian struct format
     fmt_be: str  # big-endian struct format
     size: int
+    st_le: struct.Struct = field(init=False, repr=False, compare=False)
+    st_be: struct.Struct = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "st_le", struct.Struct(self.fmt_le))
+        object.__setattr__(self, "st_be", struct.Struct(self.fmt_be))
+
+    def struct_for(self, endian: str) -> struct.Struct:
+        return self.st_le if endian == "little" else self.st_be
 
 
 PRIMITIVES: Dict[str, PrimitiveCodec] = {
@@ -25,21 +35,31 @@ PRIMITIVES: Dict[str, PrimitiveCodec] = {
 }
 
 
-def decode_primitive(encode: str, raw_bytes: bytes, *, endian: str = "little") -> float:
-    enc = encode.lower()
-    if enc not in PRIMITIVES:
+@lru_cache(maxsize=None)
+def get_codec(encode: str) -> PrimitiveCodec:
+    """Resolve an encode name (case-insensitive) to its codec."""
+    codec = PRIMITIVES.get(encode.lower())
+    if codec is None:
         raise NotImplementedError(f"Unknown encode type '{encode}'")
+    return codec
 
-    codec = PRIMITIVES[enc]
+
+def decode_primitive(encode: str, raw_bytes: bytes, *, endian: str = "little") -> float:
+    codec = get_codec(encode)
     if len(raw_bytes) != codec.size:
         raise ValueError(f"Raw bytes length {len(raw_bytes)} != expected {codec.size} for '{encode}'")
 
-    fmt = codec.fmt_le if endian == "little" else codec.fmt_be
-    return struct.unpack(fmt, raw_bytes)[0]
+    return codec.struct_for(endian).unpack(raw_bytes)[0]
+
+
+def decode_primitive_into(encode: str, buf, offset: int = 0, *, endian: str = "little") -> float:
+    """Decode one primitive at buf[offset:] without slicing the buffer."""
+    codec = get_codec(encode)
+    if offset < 0 or len(buf) - offset < codec.size:
+        raise ValueError(f"Buffer too short at offset {offset} for '{encode}' (needs {codec.size} bytes)")
+
+    return codec.struct_for(endian).unpack_from(buf, offset)[0]
 
 
 def primitive_size(encode: str) -> int:
-    enc = encode.lower()
-    if enc not in PRIMITIVES:
-        raise NotImplementedError(f"Unknown encode type '{encode}'")
-    return PRIMITIVES[enc].size
+    return get_codec(encode).size
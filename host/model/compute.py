@@ -1,18 +1,12 @@
 # host/model/compute.py
 from __future__ import annotations
 
-from typing import Callable, Iterable, List
-
-
-def _product(vals: Iterable[float]) -> float:
-    r = 1.0
-    for v in vals:
-        r *= float(v)
-    return r
+import math
+from typing import Callable, List
 
 
 OPS: dict[str, Callable[[List[float]], float]] = {
-    "multiply": lambda v: _product(v),
+    "multiply": lambda v: float(math.prod(v, start=1.0)),
     "add": lambda v: float(sum(v)),
     "mean": lambda v: float(sum(v) / len(v)),
     "min": lambda v: float(min(v)),
@@ -4,9 +4,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Optional
 
-import yaml
-
 from host.core.hashing import sha256_file
+from host.core.yaml_cache import load_yaml_file
 from .channel import Channel
 from .sensor import Sensor
 from .transport import TransportType
@@ -42,8 +41,8 @@ class MetadataLoader:
         if not full_path.exists():
             raise FileNotFoundError(f"Missing metadata file: {full_path}")
 
-        with open(full_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        # memoized by content hash: an unchanged file is parsed once per process
+        return load_yaml_file(full_path) or {}
 
     # ---------------------------------------------------------------------
     # Public entry point
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Dict, Literal, List, Optional
+from typing import Dict, Literal, List, Optional, Tuple
 
 from .channel import Channel, ChannelReading
 
@@ -82,7 +82,6 @@ class Sensor:
         self.name: str = name
         self.channels: List[Channel] = channels or []
         self.payload_order: str = payload_order
-
         self._validate()
 
     # ------------------------------------------------------------------
@@ -104,19 +103,40 @@ class Sensor:
         return self.channels_by_id.get(channel_id)
 
     def measured_channels(self) -> List[Channel]:
-        chans = [ch for ch in self.channels if ch.is_measured]
-        if self.payload_order == "insertion":
-            return chans
-        return sorted(chans, key=lambda c: c.channel_id)
+        return list(self._measured)
 
     def computed_channels(self) -> List[Channel]:
-        return sorted([ch for ch in self.channels if not ch.is_measured], key=lambda c: c.channel_id)
+        return list(self._computed)
 
     # ------------------------------------------------------------------
     # Payload decoding
     # ------------------------------------------------------------------
     def expected_payload_size(self) -> int:
-        return sum(ch.size for ch in self.measured_channels())
+        return self._payload_size
+
+    def _build_decode_plan(self) -> None:
+        """
+        Specialize decoding for the current channel list.
+
+        Resolves channel ordering, payload size and the per-field decode
+        steps once, so decode_payload() runs without sorting, attribute
+        chasing or per-field method calls. Rebuilt by _validate().
+        """
+        measured = [ch for ch in self.channels if ch.is_measured]
+        if self.payload_order != "insertion":
+            measured.sort(key=lambda c: c.channel_id)
+        self._measured: Tuple[Channel, ...] = tuple(measured)
+        self._computed: Tuple[Channel, ...] = tuple(
+            sorted((ch for ch in self.channels if not ch.is_measured), key=lambda c: c.channel_id)
+        )
+        self._payload_size: int = sum(ch.size for ch in self._measured)
+
+        # (channel_id, name, unpack_from, size, lsb, scale, unit)
+        self._measured_plan = tuple(
+            (ch.channel_id, ch.name, ch.unpack_from, ch.size, ch.lsb, ch.scale, ch.display_unit)
+            for ch in self._measured
+            if ch.unpack_from is not None
+        )
 
     def decode_payload(
         self,
@@ -127,7 +147,8 @@ class Sensor:
         source: str = "stream",
         stream_seq: Optional[int] = None,
         cmd_seq: Optional[int] = None,
-
+        capture_ts: Optional[datetime] = None,
+        is_buffered: bool = False,
     ) -> DecodedReading:
         """
         Decode measured channels from payload and optionally compute derived channels.
@@ -139,10 +160,13 @@ class Sensor:
 
         strict_length:
           If True, raises if payload length != expected measured payload length.
+
+        source / stream_seq / cmd_seq / capture_ts / is_buffered are stored on
+        the returned DecodedReading as-is.
         """
         measured: Dict[int, ChannelReading] = {}
 
-        expected = self.expected_payload_size()
+        expected = self._payload_size
         if len(payload) < expected:
             raise ValueError(
                 f"Payload too short for sensor '{self.name}' (type_id={self.type_id}): "
@@ -154,22 +178,14 @@ class Sensor:
                 f"expected {expected} bytes, got {len(payload)}."
             )
 
+        CR = ChannelReading  # local binding for the per-field loop
         offset = 0
-        for ch in self.measured_channels():
-            size = ch.size
-            raw_bytes = payload[offset: offset + size]
+        for cid, name, unpack_from, size, lsb, scale, unit in self._measured_plan:
+            raw = float(unpack_from(payload, offset)[0])
             offset += size
 
-            raw = float(ch.decode_raw_bytes(raw_bytes))
-            val = float(ch.to_display_units(raw))
-            measured[ch.channel_id] = ChannelReading(
-                channel_id=ch.channel_id,
-                name=ch.name,
-                is_measured=True,
-                raw=raw,
-                value=val,
-                unit=ch.display_unit,
-            )
+            # positional: (channel_id, name, is_measured, raw, value, unit)
+            measured[cid] = CR(cid, name, True, raw, raw * lsb * scale, unit)
 
         computed: Dict[int, ChannelReading] = {}
         if compute:
@@ -183,6 +199,8 @@ class Sensor:
             source=source,
             stream_seq=stream_seq,
             cmd_seq=cmd_seq,
+            capture_ts=capture_ts,
+            is_buffered=is_buffered,
         )
 
     def compute_channels(self, measured: Dict[int, ChannelReading]) -> Dict[int, ChannelReading]:
@@ -196,17 +214,11 @@ class Sensor:
         out: Dict[int, ChannelReading] = {}
         context: Dict[int, ChannelReading] = dict(measured)  # supports chained computed channels
 
-        for ch in self.computed_channels():
+        CR = ChannelReading
+        for ch in self._computed:
             raw_result = float(ch.evaluate_computed(context))
             value = float(ch.to_display_units(raw_result))
-            cr = ChannelReading(
-                channel_id=ch.channel_id,
-                name=ch.name,
-                is_measured=False,
-                raw=raw_result,
-                value=value,
-                unit=ch.display_unit,
-            )
+            cr = CR(ch.channel_id, ch.name, False, raw_result, value, ch.display_unit)
             out[ch.channel_id] = cr
             context[ch.channel_id] = cr
 
@@ -216,6 +228,7 @@ class Sensor:
     # Serialization / API helpers
     # ------------------------------------------------------------------
     def as_dict(self) -> dict:
+        """Metadata snapshot; a fresh dict per call, channel entries copied from their cache."""
         return {
             "type_id": self.type_id,
             "name": self.name,
@@ -262,5 +275,7 @@ class Sensor:
                         f"Channel '{ch.name}' compute.factor must be numeric (got {factor})"
                     )
 
+        self._build_decode_plan()
+
     def __repr__(self) -> str:
         return f"Sensor(type_id={self.type_id}, name='{self.name}', channels={len(self.channels)})"
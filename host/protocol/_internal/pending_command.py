@@ -9,16 +9,38 @@ if TYPE_CHECKING:
     from host.protocol.core.frames import ResponseFrame
 
 
+_MISSING = object()
+# Raw ACK payload attributes, in preference order
+_RAW_PAYLOAD_ATTRS = ("data", "payload")
+
+
 class PendingCommand:
     """Holds a Future for an asynchronous command."""
 
-    def __init__(self, seq: int, cmd_name: str, timeout_s: float):
+    def __init__(
+        self,
+        seq: int,
+        cmd_name: str,
+        timeout_s: float,
+        *,
+        ack_code: Optional[int] = None,
+        nack_code: Optional[int] = None,
+        decode_fn: Optional[Callable[[bytes], Any]] = None,
+    ):
         self.seq = int(seq)
         self.cmd_name = str(cmd_name)
         self.timeout_s = float(timeout_s)
+        # Read eagerly: ProtocolEngine measures timeouts and RTT from it.
         self.created_at = time.perf_counter()
         self.future: Future = Future()
 
+        # Frame-type codes; resolved from resp.proto when not provided
+        self.ack_code = ack_code
+        self.nack_code = nack_code
+
+        # Default ACK payload decoder, bound once at creation
+        self.decode_fn = decode_fn
+
     def add_done_callback(self, cb: Callable[[Future], Any]) -> Any:
         """Forward callback registration to the underlying Future."""
         return self.future.add_done_callback(cb)
@@ -53,8 +75,12 @@ class PendingCommand:
             return
 
         try:
-            ack_code = resp.proto.frames["ACK"]["code"]
-            nack_code = resp.proto.frames["NACK"]["code"]
+            ack_code = self.ack_code
+            nack_code = self.nack_code
+            if ack_code is None or nack_code is None:
+                frames = resp.proto.frames
+                ack_code = self.ack_code = frames["ACK"]["code"]
+                nack_code = self.nack_code = frames["NACK"]["code"]
 
             if resp.frame_type == ack_code:
                 # try decoded property first
@@ -65,9 +91,15 @@ class PendingCommand:
 
                 # fallback to raw payload bytes
                 if payload is None:
-                    payload = getattr(resp, "data", getattr(resp, "payload", b""))
-
-                # decode if decode_fn is given
+                    for name in _RAW_PAYLOAD_ATTRS:
+                        payload = getattr(resp, name, _MISSING)
+                        if payload is not _MISSING:
+                            break
+                    else:
+                        payload = b""
+
+                # decode if decode_fn is given (per call or at creation)
+                decode_fn = decode_fn or self.decode_fn
                 if decode_fn and isinstance(payload, (bytes, bytearray)):
                     try:
                         payload = decode_fn(bytes(payload))
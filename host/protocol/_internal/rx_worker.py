@@ -19,9 +19,11 @@ class RxWorker(threading.Thread):
         self._stop_event = threading.Event()
 
     def run(self) -> None:
+        # Transport reads block up to their own timeout, so only back off
+        # after an idle pump; keep draining while bytes keep arriving.
         while not self._stop_event.is_set():
             try:
-                self.engine._pump_rx()
+                got_data = self.engine._pump_rx()
             except TransportIOError:
                 if self._stop_event.is_set():
                     break
@@ -36,7 +38,8 @@ class RxWorker(threading.Thread):
                 )
                 self._stop_event.wait(0.01)
             else:
-                self._stop_event.wait(0.001)
+                if not got_data:
+                    self._stop_event.wait(0.001)
 
     def stop(self) -> None:
         self._stop_event.set()
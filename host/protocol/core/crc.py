@@ -1,11 +1,39 @@
-def crc16(proto, buf: bytes) -> int:
-    cfg = proto.constants.get("crc", {})
-    seed = cfg.get("seed", 0xFFFF)
-    poly = cfg.get("poly", 0x1021)
-
-    crc = seed
-    for b in buf:
-        crc ^= (b & 0xFF) << 8
+from binascii import crc_hqx
+from functools import lru_cache
+from typing import Callable, Tuple
+
+
+@lru_cache(maxsize=None)
+def _make_table(poly: int) -> Tuple[int, ...]:
+    """256-entry table: CRC contribution of a byte shifted into the top byte."""
+    table = []
+    for b in range(256):
+        crc = b << 8
         for _ in range(8):
             crc = ((crc << 1) ^ poly) & 0xFFFF if (crc & 0x8000) else ((crc << 1) & 0xFFFF)
-    return crc
+        table.append(crc)
+    return tuple(table)
+
+
+# CCITT polynomial: binascii.crc_hqx computes the same MSB-first, no-xorout
+# CRC in C, so the whole buffer is folded in one call.
+_CCITT_POLY = 0x1021
+
+
+@lru_cache(maxsize=None)
+def make_crc16(seed: int, poly: int) -> Callable[[bytes], int]:
+    """CRC-16 function specialized for one (seed, poly) configuration."""
+    if poly == _CCITT_POLY:
+        return lambda buf: crc_hqx(buf, seed)
+
+    # Other polynomials: input is header + payload, bounded by
+    # constants.frame_max_bytes (64), so a per-byte table walk is enough.
+    tbl = _make_table(poly)
+
+    def _crc16(buf: bytes) -> int:
+        crc = seed
+        for b in buf:
+            crc = tbl[((crc >> 8) ^ b) & 0xFF] ^ ((crc << 8) & 0xFFFF)
+        return crc
+
+    return _crc16
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from struct import calcsize, unpack
+from functools import lru_cache
+from struct import Struct
 from typing import Any, Dict, List
 
 from host.protocol.core.types import YAML_TO_STRUCT
 
 
+@lru_cache(maxsize=None)
+def _compile(fmt: str) -> Struct:
+    """Compiled Struct per format string (formats come from a small fixed set)."""
+    return Struct(fmt)
+
+
 def resolve_value(proto, v: Any, default: Any = None) -> Any:
     if isinstance(v, int):
         return v
@@ -24,39 +31,39 @@ def decode_fields(proto, payload: bytes, fields: List[Dict[str, Any]]) -> Dict[s
     for field in fields:
         ftype = field["type"]
 
-        if ftype in YAML_TO_STRUCT:
-            fmt = endian + YAML_TO_STRUCT[ftype]
-            size = calcsize(fmt)
-            if pos + size > len(payload):
+        code = YAML_TO_STRUCT.get(ftype)
+        if code is not None:
+            st = _compile(endian + code)
+            if pos + st.size > len(payload):
                 raise ValueError(f"Payload too short for field {field['name']}")
-            result[field["name"]] = unpack(fmt, payload[pos: pos + size])[0]
-            pos += size
+            result[field["name"]] = st.unpack_from(payload, pos)[0]
+            pos += st.size
             continue
 
         if ftype == "array":
             items_def = field.get("items", {})
             if items_def.get("type") == "struct":
                 struct_fields = items_def.get("fields", [])
-                # precompute struct entry size
-                struct_size = 0
+                # one Struct per record: a single unpack_from per array entry
+                names = []
+                codes = []
                 for f in struct_fields:
                     t = f["type"]
                     if t not in YAML_TO_STRUCT:
                         raise ValueError(f"Unknown struct field type '{t}' in array '{field['name']}'")
-                    struct_size += calcsize(endian + YAML_TO_STRUCT[t])
+                    names.append(f["name"])
+                    codes.append(YAML_TO_STRUCT[t])
+                entry_st = _compile(endian + "".join(codes))
+                struct_size = entry_st.size
 
                 items = []
-                while pos + struct_size <= len(payload):
-                    entry_bytes = payload[pos: pos + struct_size]
-                    entry: Dict[str, Any] = {}
-                    offset = 0
-                    for f in struct_fields:
-                        fmt = endian + YAML_TO_STRUCT[f["type"]]
-                        size = calcsize(fmt)
-                        entry[f["name"]] = unpack(fmt, entry_bytes[offset: offset + size])[0]
-                        offset += size
-                    items.append(entry)
-                    pos += struct_size
+                if struct_size:
+                    # batch: iter_unpack walks every whole record in one call
+                    span = ((len(payload) - pos) // struct_size) * struct_size
+                    if span > 0:
+                        records = memoryview(payload)[pos: pos + span]
+                        items = [dict(zip(names, vals)) for vals in entry_st.iter_unpack(records)]
+                        pos += span
 
                 result[field["name"]] = items
             else:
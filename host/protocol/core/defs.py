@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import struct
-from typing import Any, Dict
+import sys
+from operator import itemgetter
+from typing import Any, Dict, Tuple
 
 from .types import YAML_TO_STRUCT
-from .header import parse_header, build_header
-from .crc import crc16
+from .crc import make_crc16
 from .decoder import decode_response, decode_sensor_packet, resolve_value
 from ..loader import ProtocolLoader
 
 
+def resolve_payload_bounds(proto, frame_def: Dict[str, Any]) -> Tuple[int, int]:
+    """Resolve a frame definition's (min_payload, max_payload) to ints."""
+    default_max = proto.constants.get("max_payload", 1024)
+    min_len = proto.resolve_value(frame_def.get("min_payload", 0), 0)
+    max_len = proto.resolve_value(frame_def.get("max_payload", default_max), default_max)
+    return int(min_len), int(max_len)
+
+
 class Protocol:
     """Runtime access to protocol metadata."""
 
@@ -17,10 +26,17 @@ class Protocol:
         self.constants: Dict[str, Any] = loader.constants
         self.frames: Dict[str, Dict[str, Any]] = loader.frames
         self.header_def: list[Dict[str, Any]] = loader.header
-        self.commands: Dict[str, Dict[str, Any]] = loader.commands
+        # interned names: lookups with code-literal command names hit the identity fast path
+        self.commands: Dict[str, Dict[str, Any]] = {sys.intern(k): v for k, v in loader.commands.items()}
         self.errors: Dict[str, Any] = loader.errors
         self.payload_types: Dict[str, Dict[str, Any]] = loader.payload_types
-        
+
+        # Per-frame constants, resolved once
+        self.magic: int = int(self.constants.get("magic", 0xABCD))
+        self.max_payload: int = int(self.constants.get("max_payload", 1024))
+        self.cmd_none: int = int(self.constants.get("cmd_none", 0))
+        crc_cfg = self.constants.get("crc", {})
+        self._crc16 = make_crc16(crc_cfg.get("seed", 0xFFFF), crc_cfg.get("poly", 0x1021))
 
         # Build header struct
         try:
@@ -32,12 +48,37 @@ class Protocol:
             raise ValueError(f"Invalid header definition in header.yml: {e}") from e
 
         self.header_struct = struct.Struct(self.header_fmt)
+        # Bound once for the per-frame RX/TX paths
+        self.header_size: int = self.header_struct.size
+        self.header_unpack_from = self.header_struct.unpack_from
+        self.header_pack_into = self.header_struct.pack_into
+        # fields dict -> header values tuple in wire order, one C call
+        names = tuple(self.header_fields)
+        self._header_values = itemgetter(*names) if len(names) > 1 else (lambda d: (d[names[0]],))
 
         # Fast lookup maps
         self.frame_types: Dict[str, int] = {name: f["code"] for name, f in self.frames.items()}
         self.frames_by_code: Dict[int, Dict[str, Any]] = {f["code"]: f for f in self.frames.values()}
+        self.frame_name_by_code: Dict[int, str] = {f["code"]: name for name, f in self.frames.items()}
         self.error_codes: Dict[int, str] = {int(v): str(k) for k, v in self.errors.items()}
 
+        # frame code -> (min_payload, max_payload), resolved once
+        self.payload_bounds: Dict[int, Tuple[int, int]] = {
+            code: resolve_payload_bounds(self, f) for code, f in self.frames_by_code.items()
+        }
+
+        # cmd name -> compiled payload plan, filled lazily by CommandFrame.build_payload
+        self.payload_plans: Dict[str, Any] = {}
+
+        # frame code -> ResponseFrame subclass used by ResponseFrame.from_bytes
+        from .frames.response import AckFrame, NackFrame  # frames import this module
+
+        self.response_ctors: Dict[int, Any] = {
+            self.frames[name]["code"]: ctor
+            for name, ctor in (("ACK", AckFrame), ("NACK", NackFrame))
+            if name in self.frames
+        }
+
         self.commands_by_id: Dict[int, Dict[str, Any]] = {}
         for name, cmd in self.commands.items():
             cid = self.resolve_value(cmd.get("cmd_id"), None)
@@ -50,34 +91,39 @@ class Protocol:
 
     # Payload length validation (used for response frames)
     def validate_payload_len(self, frame_type: int, payload_len: int) -> bool:
-        frame_def = self.frames_by_code.get(frame_type)
-        if not frame_def:
+        bounds = self.payload_bounds.get(frame_type)
+        if bounds is None:
             return False
-
-        min_len = self.resolve_value(frame_def.get("min_payload", 0), 0)
-        max_len = self.resolve_value(
-            frame_def.get("max_payload", self.constants.get("max_payload")),
-            self.constants.get("max_payload"),
-        )
-        return int(min_len) <= int(payload_len) <= int(max_len)
+        return bounds[0] <= int(payload_len) <= bounds[1]
 
     # Delegated
     def resolve_value(self, v: Any, default: Any = None) -> Any:
         return resolve_value(self, v, default)
 
     def get_command_def(self, cmd_name: str) -> Dict[str, Any]:
-        if cmd_name not in self.commands:
+        cmd_def = self.commands.get(cmd_name)
+        if cmd_def is None:
             raise ValueError(f"Unknown command: {cmd_name}")
-        return self.commands[cmd_name]
+        return cmd_def
 
+    # Header codec on the bound Struct methods
     def parse_header(self, raw: bytes) -> Dict[str, Any]:
-        return parse_header(self, raw)
+        if len(raw) != self.header_size:
+            raise ValueError(f"Header size mismatch: {len(raw)} != {self.header_size}")
+        return dict(zip(self.header_fields, self.header_unpack_from(raw)))
+
+    def unpack_header(self, buf) -> Dict[str, Any]:
+        """Header fields from the start of buf, which may hold more than the header."""
+        return dict(zip(self.header_fields, self.header_unpack_from(buf)))
 
     def build_header(self, fields: Dict[str, Any]) -> bytes:
-        return build_header(self, fields)
+        return self.header_struct.pack(*self._header_values(fields))
+
+    def build_header_into(self, buf: bytearray, fields: Dict[str, Any], offset: int = 0) -> None:
+        self.header_pack_into(buf, offset, *self._header_values(fields))
 
     def crc16(self, buf: bytes) -> int:
-        return crc16(self, buf)
+        return self._crc16(buf)
 
     def decode_response(self, cmd_id: int, payload: bytes) -> Dict[str, Any]:
         return decode_response(self, cmd_id, payload)
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import time
 import struct
+import threading
 from dataclasses import dataclass
 from typing import Optional
 
 from ..defs import Protocol
 
+_CRC_STRUCT = struct.Struct("<H")
+
+# Per-thread encode scratch; grown on demand, only the final bytes() is fresh.
+_scratch = threading.local()
+_SCRATCH_MIN = 256
+
 
 @dataclass
 class Frame:
@@ -21,7 +28,7 @@ class Frame:
     def __post_init__(self) -> None:
         # Timestamp default (wall clock ms)
         if self.ts_ms is None:
-            self.ts_ms = int(time.time() * 1000) & 0xFFFFFFFF
+            self.ts_ms = (time.time_ns() // 1_000_000) & 0xFFFFFFFF
         else:
             self.ts_ms = int(self.ts_ms) & 0xFFFFFFFF
 
@@ -32,7 +39,7 @@ class Frame:
 
         # cmd_id default
         if self.cmd_id is None:
-            self.cmd_id = int(self.proto.constants.get("cmd_none", 0))
+            self.cmd_id = self.proto.cmd_none
         else:
             self.cmd_id = int(self.cmd_id)
 
@@ -41,25 +48,20 @@ class Frame:
         self._validate_payload_length()
 
     def _validate_payload_length(self) -> None:
-        frame_def = getattr(self.proto, "frames_by_code", {}).get(self.frame_type)
-        if not frame_def:
+        b = self.proto.payload_bounds.get(self.frame_type)
+        if b is None:
             raise ValueError(f"Unknown frame_type={self.frame_type}")
 
-        min_len = self.proto.resolve_value(frame_def.get("min_payload", 0), 0)
-        max_len = self.proto.resolve_value(
-            frame_def.get("max_payload", self.proto.constants.get("max_payload", 1024)),
-            self.proto.constants.get("max_payload", 1024),
-        )
-
+        min_len, max_len = b
         plen = len(self.payload)
-        if plen < int(min_len):
+        if plen < min_len:
             raise ValueError(f"Payload too short: {plen} < min_payload {min_len}")
-        if plen > int(max_len):
+        if plen > max_len:
             raise ValueError(f"Payload too long: {plen} > max_payload {max_len}")
 
     def encode(self) -> bytes:
         hdr_dict = {
-            "magic": self.proto.constants.get("magic", 0xABCD),
+            "magic": self.proto.magic,
             "type": self.frame_type,
             "ver": 0,
             "len": len(self.payload),
@@ -68,13 +70,24 @@ class Frame:
             "seq": self.seq,
             "ts_ms": self.ts_ms,
         }
-        header_bytes = self.proto.build_header(hdr_dict)
-        crc = self.proto.crc16(header_bytes + self.payload)
-        return header_bytes + self.payload + struct.pack("<H", crc)
+        # Assemble header | payload | crc in one preallocated buffer
+        hdr_size = self.proto.header_struct.size
+        plen = len(self.payload)
+        body_len = hdr_size + plen
+
+        total = body_len + _CRC_STRUCT.size
+
+        buf = getattr(_scratch, "buf", None)
+        if buf is None or len(buf) < total:
+            buf = _scratch.buf = bytearray(max(total, _SCRATCH_MIN))
+
+        with memoryview(buf) as mv:
+            self.proto.build_header_into(buf, hdr_dict)
+            mv[hdr_size:body_len] = self.payload
+            crc = self.proto.crc16(mv[:body_len])
+            _CRC_STRUCT.pack_into(buf, body_len, crc)
+            return bytes(mv[:total])
 
     @property
     def type_name(self) -> str:
-        for k, v in self.proto.frames.items():
-            if v["code"] == self.frame_type:
-                return k
-        return f"TYPE_{self.frame_type}"
+        return self.proto.frame_name_by_code.get(self.frame_type, f"TYPE_{self.frame_type}")
@@ -1,60 +1,67 @@
 from __future__ import annotations
 
+import itertools
 import struct
-import threading
-import time
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Iterator, Optional, Tuple
 
 from .base import Frame
 from ..defs import Protocol
 from host.protocol.core.types import YAML_TO_STRUCT
 
+# Marks a payload field with no fixed "value" (taken from call args instead)
+_FROM_ARGS = object()
+
+PayloadPlan = Tuple[struct.Struct, Tuple[Tuple[str, Any], ...]]
+
+
+def compile_payload(cmd_name: str, cmd_def: dict) -> PayloadPlan:
+    """Fuse a command's payload fields into one Struct plus (name, fixed value) slots."""
+    codes = []
+    slots = []
+    for field in cmd_def.get("payload", []):
+        ftype = field["type"]
+        if ftype not in YAML_TO_STRUCT:
+            raise ValueError(f"Unknown field type '{ftype}' in command '{cmd_name}'")
+        codes.append(YAML_TO_STRUCT[ftype])
+        slots.append((field["name"], field["value"] if "value" in field else _FROM_ARGS))
+    return struct.Struct("<" + "".join(codes)), tuple(slots)
+
 
 class CommandFrame(Frame):
     """Host → device command frame."""
 
-    _seq_counter: ClassVar[int] = 1
-    _seq_lock: ClassVar[threading.Lock] = threading.Lock()
+    # next() on itertools.count is a single C call, atomic under the GIL
+    _seq_iter: ClassVar[Iterator[int]] = itertools.count(1)
 
     @classmethod
     def next_seq(cls) -> int:
-        with cls._seq_lock:
-            s = cls._seq_counter
-            cls._seq_counter = (s + 1) & 0xFFFFFFFF
-            if cls._seq_counter == 0:
-                cls._seq_counter = 1
-            return s
+        # uint32 on the wire; 0 is skipped when the counter wraps
+        s = next(cls._seq_iter) & 0xFFFFFFFF
+        return s or next(cls._seq_iter) & 0xFFFFFFFF
 
     @staticmethod
     def build_payload(proto: Protocol, cmd_name: str, args: Optional[dict] = None) -> bytes:
-        cmd_def = proto.get_command_def(cmd_name)
         args = args or {}
 
-        payload_bytes: list[bytes] = []
+        # Plans are compiled once per command and kept on the Protocol
+        plans = proto.payload_plans
+        plan = plans.get(cmd_name)
+        if plan is None:
+            plan = plans.setdefault(cmd_name, compile_payload(cmd_name, proto.get_command_def(cmd_name)))
+        st, slots = plan
 
-        for field in cmd_def.get("payload", []):
-            ftype = field["type"]
-            if ftype not in YAML_TO_STRUCT:
-                raise ValueError(f"Unknown field type '{ftype}' in command '{cmd_name}'")
-
-            fmt = "<" + YAML_TO_STRUCT[ftype]
-
-            val = field.get("value", args.get(field["name"]))
+        values = []
+        for name, fixed in slots:
+            val = args.get(name) if fixed is _FROM_ARGS else fixed
             if val is None:
-                raise KeyError(f"Missing command argument '{field['name']}' for {cmd_name}")
+                raise KeyError(f"Missing command argument '{name}' for {cmd_name}")
+            values.append(val)
 
-            payload_bytes.append(struct.pack(fmt, val))
-
-        full_payload = b"".join(payload_bytes)
+        full_payload = st.pack(*values)
 
         # Validate command payload length against CMD frame constraints
-        frame_def = proto.frames["CMD"]
-        min_len = proto.resolve_value(frame_def.get("min_payload", 0), 0)
-        max_len = proto.resolve_value(
-            frame_def.get("max_payload", proto.constants.get("max_payload", 1024)),
-            proto.constants.get("max_payload", 1024),
-        )
-        if not (int(min_len) <= len(full_payload) <= int(max_len)):
+        min_len, max_len = proto.payload_bounds[proto.frames["CMD"]["code"]]
+        if not (min_len <= len(full_payload) <= max_len):
             raise ValueError(
                 f"Command payload length {len(full_payload)} outside [{min_len}, {max_len}]"
             )
@@ -64,7 +71,9 @@ class CommandFrame(Frame):
     def __init__(self, proto: Protocol, cmd_name: str, args: Optional[dict] = None, rsv: int = 0):
         payload = self.build_payload(proto, cmd_name, args)
         cmd_def = proto.get_command_def(cmd_name)
-        cmd_id = proto.resolve_value(cmd_def.get("cmd_id"), proto.constants.get("cmd_none", 0))
+        cmd_id = cmd_def.get("cmd_id")
+        if cmd_id.__class__ is not int:  # literal ids skip the constants lookup
+            cmd_id = proto.resolve_value(cmd_id, proto.cmd_none)
 
         super().__init__(
             proto=proto,
@@ -72,7 +81,7 @@ class CommandFrame(Frame):
             seq=self.next_seq(),
             payload=payload,
             cmd_id=int(cmd_id),
-            ts_ms=int(time.time() * 1000),
+            ts_ms=None,  # stamped once by Frame.__post_init__
             rsv=rsv,
         )
         self.cmd_name = cmd_name
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any, ClassVar, Dict, Optional
 
 from .base import Frame
@@ -15,23 +16,23 @@ class ResponseFrame(Frame):
     """
 
     @classmethod
-    def from_bytes(cls, proto: Protocol, raw_header: bytes, payload: bytes) -> "ResponseFrame":
-        hdr = proto.parse_header(raw_header)
+    def from_bytes(
+        cls,
+        proto: Protocol,
+        raw_header: bytes,
+        payload: bytes,
+        hdr: Optional[Dict[str, Any]] = None,
+    ) -> "ResponseFrame":
+        # Callers that already parsed raw_header (FrameParser) pass it as hdr
+        if hdr is None:
+            hdr = proto.parse_header(raw_header)
         ftype = hdr["type"]
         rsv = hdr.get("rsv", 0)
 
-        if ftype == proto.frames["ACK"]["code"]:
-            return AckFrame(
-                proto=proto,
-                seq=hdr["seq"],
-                payload=payload,
-                ts_ms=hdr["ts_ms"],
-                cmd_id=hdr.get("cmd_id"),
-                rsv=rsv,
-            )
-
-        if ftype == proto.frames["NACK"]["code"]:
-            return NackFrame(
+        # frame code -> subclass, built once by Protocol
+        frame_cls = proto.response_ctors.get(ftype)
+        if frame_cls is not None:
+            return frame_cls(
                 proto=proto,
                 seq=hdr["seq"],
                 payload=payload,
@@ -79,12 +80,14 @@ class AckFrame(ResponseFrame):
     def data(self) -> bytes:
         return self.payload
 
-    @property
+    @cached_property
     def decoded(self) -> Dict[str, Any]:
         # cmd_id is always set by Frame.__post_init__ defaulting to cmd_none
-        data = self.proto.decode_response(int(self.cmd_id), self.payload)
-        data.update({"seq": self.seq, "ts_ms": self.ts_ms})
-        return data
+        return {
+            **self.proto.decode_response(int(self.cmd_id), self.payload),
+            "seq": self.seq,
+            "ts_ms": self.ts_ms,
+        }
 
 
 class NackFrame(ResponseFrame):
@@ -116,7 +119,7 @@ class NackFrame(ResponseFrame):
             return int(self.proto.errors.get("UNKNOWN", 255))  # fallback
         return self.payload[0]
 
-    @property
+    @cached_property
     def error(self) -> Dict[str, Any]:
         code = int(self.error_code)
         name = self.proto.error_codes.get(code, "UNKNOWN")
@@ -149,19 +152,22 @@ class StreamFrame(Frame):
             seq=seq,
             payload=payload,  # keep full payload including runtime id
             ts_ms=ts_ms,
-            cmd_id=proto.constants.get("cmd_none", 0),
+            cmd_id=None,  # resolved to cmd_none by Frame
             rsv=rsv,
         )
 
-    @property
+    @cached_property
     def decoded(self) -> dict[str, Any]:
         """
-        Decode the stream payload.
+        Decode the stream payload (built once per frame).
         Returns dict with runtime_id, raw_readings, seq, ts_ms.
+
+        raw_readings is a zero-copy memoryview over the payload body;
+        call bytes(...) on it if an owned copy is needed.
         """
-        
-        runtime_id = self.payload[0]
-        raw_readings = self.payload[1:]
-        data = {"sensor_runtime_id": runtime_id, "raw_readings": raw_readings}
-        data.update({"seq": self.seq, "ts_ms": self.ts_ms})
-        return data
+        return {
+            "sensor_runtime_id": self.payload[0],
+            "raw_readings": memoryview(self.payload)[1:],
+            "seq": self.seq,
+            "ts_ms": self.ts_ms,
+        }
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+import struct
 from typing import Optional
 
 from .frames import ResponseFrame, StreamFrame, Frame
 from .defs import Protocol
 
+_CRC_STRUCT = struct.Struct("<H")  # 16-bit CRC trailer, little-endian
+
 
 class FrameParser:
     def __init__(self, proto: Protocol, logger: Optional[logging.Logger] = None):
@@ -13,55 +16,70 @@ class FrameParser:
         self.buffer = bytearray()
         self._log = logger or logging.getLogger(__name__)
 
+        # Protocol lookups resolved once instead of per frame
+        self._hdr_size = proto.header_struct.size
+        self._max_payload = proto.max_payload
+        self._magic_bytes = proto.magic.to_bytes(2, "little")
+        self._cmd_none = proto.cmd_none
+        self._stream_code = proto.frames["STREAM"]["code"]
+        # Header straight off the rx buffer, no slice copy
+        self._unpack_header = proto.unpack_header
+        self._crc16 = proto.crc16
+        # frame code -> (min, max) payload length, precomputed by Protocol
+        self._len_bounds = proto.payload_bounds
+
     # ---------------- Public API ----------------
     def feed(self, data: bytes) -> None:
         """Feed raw bytes into the parser buffer."""
         self.buffer.extend(data)
-        self._log.debug(
-            "Parser fed %d bytes, buffer_len=%d",
-            len(data),
-            len(self.buffer),
-        )
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug(
+                "Parser fed %d bytes, buffer_len=%d",
+                len(data),
+                len(self.buffer),
+            )
 
     def get_frame(self) -> Optional[Frame]:
         """Parse and return the next complete frame, if available."""
+        hdr_size = self._hdr_size
+        max_payload = self._max_payload
+        len_bounds = self._len_bounds
+        unpack_header = self._unpack_header
+        buf = self.buffer
         while True:
-            hdr_size = self.proto.header_struct.size
-            if len(self.buffer) < hdr_size:
+            if len(buf) < hdr_size:
                 return None  # Not enough bytes for header
 
             magic_idx = self._sync_magic()
-            if magic_idx < 0 or len(self.buffer) < hdr_size:
+            if magic_idx < 0 or len(buf) < hdr_size:
                 return None  # Wait for more bytes
 
-            hdr_bytes = self.buffer[:hdr_size]
             try:
-                hdr = self.proto.parse_header(hdr_bytes)
+                hdr = unpack_header(buf)
             except Exception:
                 self._log.debug("Header parse failed, skipping first 2 bytes")
-                del self.buffer[:2]
+                del buf[:2]
                 continue
 
             payload_len = hdr.get("len", 0)
-            max_payload = self.proto.constants.get("max_payload", 1024)
             if payload_len > max_payload:
                 self._log.warning(
                     "Payload length too large: %d (max=%d), skipping magic",
                     payload_len,
                     max_payload,
                 )
-                del self.buffer[:2]
+                del buf[:2]
                 continue
 
-            crc_len = 2  # 16-bit CRC
-            total_len = hdr_size + payload_len + crc_len
-            if len(self.buffer) < total_len:
+            body_len = hdr_size + payload_len
+            total_len = body_len + _CRC_STRUCT.size
+            if len(buf) < total_len:
                 return None  # Wait for more bytes
 
-            frame_bytes = self.buffer[:total_len]
-            payload = frame_bytes[hdr_size: hdr_size + payload_len]
-            rx_crc = int.from_bytes(frame_bytes[-crc_len:], "little")
-            calc_crc = self.proto.crc16(frame_bytes[:-crc_len])
+            # CRC straight off the buffer; the view is released before buf is trimmed
+            with memoryview(buf) as mv:
+                calc_crc = self._crc16(mv[:body_len])
+            rx_crc = _CRC_STRUCT.unpack_from(buf, body_len)[0]
 
             if calc_crc != rx_crc:
                 self._log.warning(
@@ -69,31 +87,36 @@ class FrameParser:
                     calc_crc,
                     rx_crc,
                 )
-                del self.buffer[:2]
+                del buf[:2]
                 continue
 
             # Extract Frame-type
             ftype = hdr["type"]
 
             # Enforce frame-level payload constraints
-            if not self.proto.validate_payload_len(ftype, payload_len):
+            bounds = len_bounds.get(ftype)
+            if bounds is None or not bounds[0] <= payload_len <= bounds[1]:
                 self._log.warning(
                     "Invalid payload length %d for frame type %s, dropping frame",
                     payload_len,
                     ftype,
                 )
-                del self.buffer[:total_len]
+                del buf[:total_len]
                 continue
 
-            # Remove processed bytes
-            del self.buffer[:total_len]
+            # Own only the header + payload, then remove processed bytes
+            with memoryview(buf) as mv:
+                hdr_bytes = bytes(mv[:hdr_size])
+                # typical ACK/NACK has no payload: skip the copy
+                payload = bytes(mv[hdr_size:body_len]) if payload_len else b""
+            del buf[:total_len]
 
             # Extract header fields
-            cmd_id = hdr.get("cmd_id", self.proto.constants.get("cmd_none", 0))
+            cmd_id = hdr.get("cmd_id", self._cmd_none)
             rsv = hdr.get("rsv", 0)
 
             # Instantiate proper frame
-            if ftype == self.proto.frames["STREAM"]["code"]:
+            if ftype == self._stream_code:
                 frame = StreamFrame(
                     proto=self.proto,
                     seq=hdr["seq"],
@@ -101,32 +124,39 @@ class FrameParser:
                     ts_ms=hdr["ts_ms"],
                     rsv=rsv,
                 )
-            else:
-                frame = ResponseFrame.from_bytes(self.proto, hdr_bytes, payload)
-                frame.cmd_id = cmd_id
-                frame.rsv = rsv
+                frame._raw_header = hdr_bytes
+                frame._hdr = hdr
+                # No per-frame logging on the stream path (engine logs a periodic count)
+                return frame
+
+            frame = ResponseFrame.from_bytes(self.proto, hdr_bytes, payload, hdr=hdr)
+            frame.cmd_id = cmd_id
+            frame.rsv = rsv
 
             # Store raw header for diagnostics
-            frame._raw_header = bytes(hdr_bytes)
+            frame._raw_header = hdr_bytes
             frame._hdr = hdr
 
-            self._log.debug(
-                "Parsed frame type=%s seq=%s cmd_id=%s payload_len=%d total_len=%d",
-                ftype,
-                hdr.get("seq"),
-                cmd_id,
-                payload_len,
-                total_len,
-            )
+            if self._log.isEnabledFor(logging.DEBUG):
+                self._log.debug(
+                    "Parsed frame type=%s seq=%s cmd_id=%s payload_len=%d total_len=%d",
+                    ftype,
+                    hdr.get("seq"),
+                    cmd_id,
+                    payload_len,
+                    total_len,
+                )
 
             return frame
 
     # ---------------- Helpers ----------------
     def _sync_magic(self) -> int:
         """Locate the first magic word in the buffer and discard preceding bytes."""
-        magic_val = self.proto.constants.get("magic", 0xABCD)
-        magic_bytes = magic_val.to_bytes(2, "little")
-        idx = self.buffer.find(magic_bytes)
+        idx = self.buffer.find(self._magic_bytes)
         if idx > 0:
             del self.buffer[:idx]
+        elif idx < 0 and len(self.buffer) > 1:
+            # No magic anywhere: drop the garbage so it is not rescanned,
+            # keeping the last byte in case it starts a split magic word.
+            del self.buffer[:-1]
         return idx
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 import logging
-import threading
 import time
-from typing import Callable, Dict, Optional, Protocol as TypingProtocol
+from collections import deque
+from functools import partial
+from heapq import heappop, heappush
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, Protocol as TypingProtocol
 
 from . import CommandFrame, Protocol, StreamFrame
 from host.interfaces.command_sink import CommandEvent ,CommandSink
@@ -19,6 +21,16 @@ class TransportIO(TypingProtocol):
     def write(self, data: bytes) -> int: ...
     def read(self, size: int) -> bytes: ...
     def flush(self) -> None: ...
+    # Optional: def bytes_available(self) -> int  (bytes readable without blocking)
+    # Optional: def write_all(self, data: bytes) -> int  (retries short writes)
+
+
+# RX read size when nothing is buffered; otherwise the buffered count, capped at _RX_READ_MAX
+_RX_READ_MIN = 256
+_RX_READ_MAX = 65536
+
+# Stream frames are not logged individually; a running count is logged every 1024
+_STREAM_LOG_EVERY_MASK = 1024 - 1
 
 
 class ProtocolEngine:
@@ -49,13 +61,32 @@ class ProtocolEngine:
         self._rx_thread: Optional[RxWorker] = None
         self.on_stream: Optional[Callable[[StreamFrame], None]] = None
 
-        self._lock = threading.Lock()
+        # seq -> in-flight command. Accessed without a lock: single dict
+        # get/set/pop calls are atomic in CPython, and whoever pops a seq owns
+        # resolving it (RX thread on ACK/NACK/timeout, sender on write failure).
         self._pending: Dict[int, PendingCommand] = {}
 
+        # (expires_at, seq) min-heap, owned by the RX thread. Senders hand new
+        # entries over through a deque so the heap itself is never shared.
+        self._expiry_heap: List[Tuple[float, int]] = []
+        self._expiry_intake: Deque[Tuple[float, int]] = deque()
+
         self.STREAM_CODE = proto.frames["STREAM"]["code"]
         self.ACK_CODE = proto.frames["ACK"]["code"]
         self.NACK_CODE = proto.frames["NACK"]["code"]
 
+        # frame_type -> handler; other frame types are ignored by the pump
+        self._frame_handlers: Dict[int, Callable[[Any], None]] = {
+            self.ACK_CODE: self._handle_ack,
+            self.NACK_CODE: self._handle_nack,
+            self.STREAM_CODE: self._handle_stream,
+        }
+
+        self._stream_count = 0  # STREAM frames seen; logged every 1024
+
+        self._bytes_available: Optional[Callable[[], int]] = getattr(transport, "bytes_available", None)
+        self._write: Callable[[bytes], int] = getattr(transport, "write_all", None) or transport.write
+
     # ---------------- Decoder ----------------
     def _decode_response(self, cmd_name: str, payload: bytes) -> dict:
         """
@@ -63,10 +94,9 @@ class ProtocolEngine:
         """
         try:
             cmd_def = self.proto.get_command_def(cmd_name)
-            cmd_id = self.proto.resolve_value(
-                cmd_def.get("cmd_id"),
-                self.proto.constants.get("cmd_none", 0),
-            )
+            cmd_id = cmd_def.get("cmd_id")
+            if cmd_id.__class__ is not int:  # literal ids skip the constants lookup
+                cmd_id = self.proto.resolve_value(cmd_id, self.proto.cmd_none)
             return self.proto.decode_response(cmd_id, payload)
         except Exception:
             self._log.warning("CMD_DECODE_FAILED cmd=%s payload_len=%d", cmd_name, len(payload))
@@ -80,10 +110,18 @@ class ProtocolEngine:
         frame = CommandFrame(self.proto, cmd_name, args=kwargs)
         raw = frame.encode()
 
-        self._log.debug("SENDING_FRAME cmd=%s len=%d raw=%s", cmd_name, len(raw), raw.hex())
+        if self._log.isEnabledFor(logging.DEBUG):  # skip raw.hex() when not logged
+            self._log.debug("SENDING_FRAME cmd=%s len=%d raw=%s", cmd_name, len(raw), raw.hex())
 
         seq = frame.seq
-        pending = PendingCommand(seq, cmd_name, self.cmd_timeout_s)
+        pending = PendingCommand(
+            seq,
+            cmd_name,
+            self.cmd_timeout_s,
+            ack_code=self.ACK_CODE,
+            nack_code=self.NACK_CODE,
+            decode_fn=partial(self._decode_response, cmd_name),
+        )
 
         # Command event
         if self._cmd_sink:
@@ -141,21 +179,19 @@ class ProtocolEngine:
 
             pending.add_done_callback(_on_done)
 
-        with self._lock:
-            self._pending[seq] = pending
+        self._track_pending(pending)
 
         try:
-            self.transport.write(raw)
+            self._write(raw)
             try:
                 self.transport.flush()
             except Exception:
                 pass
         except Exception as e:
-            with self._lock:
-                self._pending.pop(seq, None)
+            self._pending.pop(seq, None)
 
             # Send failure.
-            pending.set_result(None, "send_failed", decode_fn=self._decode_response)
+            pending.set_result(None, "send_failed")
             if isinstance(e, TransportIOError):
                 self._log.warning("CMD_SEND_FAILED cmd=%s reason=%s", cmd_name, e)
             else:
@@ -192,48 +228,76 @@ class ProtocolEngine:
                 self._log.info("RX_THREAD_STOPPED")
 
     # ---------------- RX Pump ----------------
-    def _pump_rx(self) -> None:
-        data = self.transport.read(256)
+    def _pump_rx(self) -> bool:
+        """Run one RX iteration. Returns True if any bytes were received."""
+        size = _RX_READ_MIN
+        if self._bytes_available is not None:
+            # Read exactly what is buffered: returns at once, all in one read
+            size = min(self._bytes_available() or _RX_READ_MIN, _RX_READ_MAX)
+
+        data = self.transport.read(size)
         if data:
             self._parser.feed(data)
 
+        handlers = self._frame_handlers
+        get_frame = self._parser.get_frame
         while True:
-            frame = self._parser.get_frame()
+            frame = get_frame()
             if frame is None:
                 break
 
-            seq = getattr(frame, "seq", None)
-            if frame.frame_type in (self.ACK_CODE, self.NACK_CODE) and seq is not None:
-                with self._lock:
-                    pending = self._pending.pop(seq, None)
-                if pending:
-                    decode_fn = lambda payload, cmd_name=pending.cmd_name: self._decode_response(cmd_name, payload)
-                    status = "ok" if frame.frame_type == self.ACK_CODE else "fail"
-                    pending.set_result(frame, status, decode_fn=decode_fn)
+            handler = handlers.get(frame.frame_type)
+            if handler is not None:
+                handler(frame)
 
-            elif frame.frame_type == self.STREAM_CODE:
-                self._handle_stream(frame)
-
-        # Cleanup expired pending commands
+        # Cleanup expired pending commands: only heap entries past their deadline
         now = time.perf_counter()
         expired_items: list[PendingCommand] = []
-        expired_seqs: list[int] = []
 
-        with self._lock:
-            for seq, pending in list(self._pending.items()):
-                if (now - pending.created_at) > pending.timeout_s:
-                    expired_items.append(pending)
-                    expired_seqs.append(seq)
+        heap = self._expiry_heap
+        intake = self._expiry_intake
+        while intake:
+            heappush(heap, intake.popleft())
 
-            for seq in expired_seqs:
-                self._pending.pop(seq, None)
+        while heap and heap[0][0] < now:
+            _, seq = heappop(heap)
+            # Already answered (or send failed) if someone else popped it
+            pending = self._pending.pop(seq, None)
+            if pending is not None:
+                expired_items.append(pending)
 
         for pending in expired_items:
-            decode_fn = lambda payload, cmd_name=pending.cmd_name: self._decode_response(cmd_name, payload)
-            pending.set_result(None, "timeout", decode_fn=decode_fn)
+            pending.set_result(None, "timeout")
+
+        return bool(data)
+
+    def _track_pending(self, pending: PendingCommand) -> None:
+        """Register an in-flight command and schedule its timeout."""
+        self._pending[pending.seq] = pending
+        self._expiry_intake.append((pending.created_at + pending.timeout_s, pending.seq))
+
+    # ---------------- Responses ----------------
+    def _handle_ack(self, frame) -> None:
+        self._resolve_pending(frame, "ok")
+
+    def _handle_nack(self, frame) -> None:
+        self._resolve_pending(frame, "fail")
+
+    def _resolve_pending(self, frame, status: str) -> None:
+        seq = getattr(frame, "seq", None)
+        if seq is None:
+            return
+        pending = self._pending.pop(seq, None)
+        if pending:
+            # ACK payload decoder was bound to the pending at send time
+            pending.set_result(frame, status)
 
     # ---------------- Stream ----------------
     def _handle_stream(self, frame: StreamFrame) -> None:
+        self._stream_count += 1
+        if not self._stream_count & _STREAM_LOG_EVERY_MASK:
+            self._log.debug("STREAM_RX count=%d", self._stream_count)
+
         if self.on_stream:
             try:
                 self.on_stream(frame)
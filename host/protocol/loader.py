@@ -4,9 +4,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict
 
-import yaml
-
 from host.core.hashing import sha256_file
+from host.core.yaml_cache import load_yaml_file
 
 
 class ProtocolLoader:
@@ -105,6 +104,4 @@ class ProtocolLoader:
             raise ValueError(f"Invalid protocol version in constants.yml: {v!r}")
 
     def _load_yaml(self, filename: str) -> Dict[str, Any]:
-        path = self.config_dir / filename
-        with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        return load_yaml_file(self.config_dir / filename) or {}
@@ -87,6 +87,31 @@ class McuClient:
         resp = self._engine.send_cmd("START_STREAM", sensor_runtime_id=int(sensor_runtime_id))
         self._require_ok(resp, "START_STREAM")
 
+    def set_period_and_start(self, sensor_runtime_id: int, period_ms: int) -> None:
+        """
+        SET_PERIOD followed by START_STREAM, pipelined: both frames are sent
+        before waiting, so the pair costs one command round-trip. The MCU
+        handles commands in order, so the stream starts at the new period.
+
+        If SET_PERIOD fails, a START_STREAM the MCU already accepted is undone
+        with STOP_STREAM before the error is raised, so no stream is left
+        running at the old period.
+        """
+        rid = int(sensor_runtime_id)
+        timeout_s = self._engine.cmd_timeout_s
+        set_handle = self._engine.send_cmd_async("SET_PERIOD", sensor_runtime_id=rid, period_ms=int(period_ms))
+        start_handle = self._engine.send_cmd_async("START_STREAM", sensor_runtime_id=rid)
+        try:
+            self._require_ok(set_handle.wait(timeout=timeout_s), "SET_PERIOD", timeout_s=timeout_s)
+        except (CommandFailed, CommandTimeout, SendFailed):
+            if start_handle.wait(timeout=timeout_s).get("status") == "ok":
+                try:
+                    self.stop_stream(rid)
+                except (CommandFailed, CommandTimeout, SendFailed):
+                    pass  # report the SET_PERIOD failure, not the cleanup one
+            raise
+        self._require_ok(start_handle.wait(timeout=timeout_s), "START_STREAM", timeout_s=timeout_s)
+
     def stop_stream(self, sensor_runtime_id: int) -> None:
         resp = self._engine.send_cmd("STOP_STREAM", sensor_runtime_id=int(sensor_runtime_id))
         self._require_ok(resp, "STOP_STREAM")
@@ -4,7 +4,7 @@ from __future__ import annotations
 import logging
 import threading
 import time
-from typing import Callable, Dict, List, Optional, Mapping
+from typing import Callable, Dict, List, Optional, Mapping, Tuple
 from dataclasses import replace
 
 from host.runtime.device_link import DeviceLink
@@ -23,6 +23,18 @@ ReadingCallback = Callable[[int, DecodedReading], None]  # (runtime_id, reading)
 RawStreamCallback = Callable[[StreamFrame], None]        # optional debug hook
 
 
+# Bounded staleness of status().mcu.last_seen_s while streaming
+_STREAM_MARK_INTERVAL_NS = 50_000_000
+
+
+def _without(cbs: tuple, cb: Callable) -> tuple:
+    """Copy of cbs minus the first occurrence of cb (list.remove semantics)."""
+    for i, c in enumerate(cbs):
+        if c == cb:
+            return cbs[:i] + cbs[i + 1:]
+    return cbs
+
+
 class DeviceSession:
     """
     High-level device session managing DeviceLink, McuClient, and runtime sensor state.
@@ -57,14 +69,23 @@ class DeviceSession:
         self._client: Optional[McuClient] = None
 
         self._runtime_to_type: Dict[int, int] = {}
+        # runtime_id -> catalog Sensor, rebuilt by refresh_sensors and swapped
+        # as a whole so the stream path can read it without the lock
+        self._runtime_to_sensor: Dict[int, Sensor] = {}
         self._sensors: Dict[int, SensorState] = {}
+        # Immutable snapshot of _sensors.values() handed out by status();
+        # reset to None whenever _sensors changes.
+        self._sensors_view: Optional[Tuple[SensorState, ...]] = None
 
-        self._reading_cbs: List[ReadingCallback] = []
-        self._raw_stream_cbs: List[RawStreamCallback] = []
+        # Copy-on-write tuples: subscribers swap in a new tuple under the lock,
+        # the stream path iterates the current reference without locking.
+        self._reading_cbs: Tuple[ReadingCallback, ...] = ()
+        self._raw_stream_cbs: Tuple[RawStreamCallback, ...] = ()
 
         self._transport_last_error: Optional[str] = None
         self._mcu_last_error: Optional[str] = None
         self._mcu_last_seen_monotonic: Optional[float] = None
+        self._stream_mark_ns = 0  # monotonic_ns of the last stream-driven _mark_mcu_ok
         self._mcu_uptime_s: Optional[float] = None
         self._board_uid_hex: Optional[str] = None
 
@@ -142,12 +163,23 @@ class DeviceSession:
         self._log.info("SESSION_STOP")
         with self._lock:
             self._client = None
+
+        # Joins the RX thread and closes the transport, which may block on a
+        # stuck device: never hold self._lock across it (the RX thread's
+        # _on_stream_frame takes it for liveness stamps).
+        self._link.stop()
+
+        # Cleared after the RX thread is gone, so an in-flight frame cannot
+        # re-stamp liveness on a stopped session.
+        with self._lock:
             self._runtime_to_type.clear()
+            self._runtime_to_sensor = {}
             self._sensors.clear()
+            self._sensors_view = None
             self._mcu_last_seen_monotonic = None
+            self._stream_mark_ns = 0
             self._mcu_last_error = None
             self._board_uid_hex = None
-        self._link.stop()
 
     def status(self) -> SessionStatus:
         with self._lock:
@@ -186,7 +218,9 @@ class DeviceSession:
                 last_error=self._mcu_last_error,
             )
 
-            sensors = list(self._sensors.values())
+            sensors = self._sensors_view
+            if sensors is None:
+                sensors = self._sensors_view = tuple(self._sensors.values())
 
         return SessionStatus(
             transport=transport_state,
@@ -202,19 +236,22 @@ class DeviceSession:
         runtime_to_type: Dict[int, int] = {s.runtime_id: s.type_id for s in sensors}
 
         new_states: Dict[int, SensorState] = {}
+        runtime_to_sensor: Dict[int, Sensor] = {}
         with self._lock:
             old_states = dict(self._sensors)
 
         for s in sensors:
-            sensor_meta = self._sensors_catalog.get(int(s.type_id))
+            sensor_meta = self._sensors_catalog.get(s.type_id)
             name = sensor_meta.name if sensor_meta else f"type_id={s.type_id}"
+            if sensor_meta is not None:
+                runtime_to_sensor[s.runtime_id] = sensor_meta
 
             old = old_states.get(s.runtime_id)
             period_ms: int | None = old.period_ms if old else None
             try:
-                period_ms = int(client.get_period(int(s.runtime_id)))
+                period_ms = int(client.get_period(s.runtime_id))
             except Exception as e:
-                self._log.debug("GET_PERIOD_FAILED runtime_id=%d err=%s", int(s.runtime_id), e)
+                self._log.debug("GET_PERIOD_FAILED runtime_id=%d err=%s", s.runtime_id, e)
 
             new_states[s.runtime_id] = SensorState(
                 runtime_id=s.runtime_id,
@@ -227,7 +264,9 @@ class DeviceSession:
 
         with self._lock:
             self._runtime_to_type = runtime_to_type
+            self._runtime_to_sensor = runtime_to_sensor
             self._sensors = new_states
+            self._sensors_view = None
         self._mark_mcu_ok()
 
         return list(new_states.values())
@@ -265,6 +304,16 @@ class DeviceSession:
         self._set_sensor_state(sensor_runtime_id, streaming=True, last_error=None)
         self._mark_mcu_ok()
 
+    def configure_stream(self, sensor_runtime_id: int, *, period_ms: int) -> None:
+        """set_period + start_stream in one pipelined MCU dialog."""
+        self._log.info(
+            "CONFIGURE_STREAM sensor_runtime_id=%d period_ms=%d", int(sensor_runtime_id), int(period_ms)
+        )
+        client = self._require_client()
+        client.set_period_and_start(sensor_runtime_id, period_ms=period_ms)
+        self._set_sensor_state(sensor_runtime_id, streaming=True, period_ms=int(period_ms), last_error=None)
+        self._mark_mcu_ok()
+
     def stop_stream(self, sensor_runtime_id: int) -> None:
         self._log.info("STOP_STREAM sensor_runtime_id=%d", int(sensor_runtime_id))
         client = self._require_client()
@@ -301,8 +350,6 @@ class DeviceSession:
             self._log.warning("READ_SENSOR_FAILED runtime_id=%d: raw_readings invalid type", sensor_runtime_id)
             return None
 
-        payload_bytes = bytes(raw)
-
         # --- Resolve sensor ---
         type_id = self._runtime_to_type.get(sensor_runtime_id)
         if type_id is None:
@@ -316,51 +363,45 @@ class DeviceSession:
 
         # --- Decode payload ---
         try:
-            base = sensor_meta.decode_payload(payload_bytes, compute=True, source="read_sensor", cmd_seq=cmd_seq)
+            reading = sensor_meta.decode_payload(
+                raw,  # decode_payload only unpack_from()s, no copy needed
+                compute=True,
+                source="read_sensor",
+                cmd_seq=int(cmd_seq) if cmd_seq is not None else None,
+            )
         except Exception as e:
             self._set_sensor_state(sensor_runtime_id, last_error=str(e))
             self._mark_mcu_ok()
             self._log.warning("READ_SENSOR_FAILED runtime_id=%d: %s", sensor_runtime_id, e)
             return None
 
-        reading = replace(
-            base,
-            source="read_sensor",
-            stream_seq=None,
-            cmd_seq=int(cmd_seq) if cmd_seq is not None else None,
-        )
         self._mark_mcu_ok()
         return reading
 
 
     def subscribe_readings(self, cb: ReadingCallback) -> Callable[[], None]:
         with self._lock:
-            self._reading_cbs.append(cb)
+            self._reading_cbs = self._reading_cbs + (cb,)
 
         def _unsubscribe() -> None:
             with self._lock:
-                if cb in self._reading_cbs:
-                    self._reading_cbs.remove(cb)
+                self._reading_cbs = _without(self._reading_cbs, cb)
 
         return _unsubscribe
 
     def subscribe_raw_stream(self, cb: RawStreamCallback) -> Callable[[], None]:
         with self._lock:
-            self._raw_stream_cbs.append(cb)
+            self._raw_stream_cbs = self._raw_stream_cbs + (cb,)
 
         def _unsubscribe() -> None:
             with self._lock:
-                if cb in self._raw_stream_cbs:
-                    self._raw_stream_cbs.remove(cb)
+                self._raw_stream_cbs = _without(self._raw_stream_cbs, cb)
 
         return _unsubscribe
 
     def _on_stream_frame(self, frame: StreamFrame, *, capture_ts=None, is_buffered=False) -> None:
         # Fan out raw frames first (debug / tracing hooks)
-        with self._lock:
-            raw_cbs = list(self._raw_stream_cbs)
-    
-        for cb in raw_cbs:
+        for cb in self._raw_stream_cbs:
             try:
                 cb(frame)
             except Exception:
@@ -368,11 +409,12 @@ class DeviceSession:
 
         # Decode STREAM frame (sensor_runtime_id is inside payload)
         try:
+            # StreamFrame.decoded yields ints (payload byte / Frame.seq)
             d = frame.decoded
 
-            runtime_id = int(d["sensor_runtime_id"])
+            runtime_id = d["sensor_runtime_id"]
             payload = d["raw_readings"]
-            stream_seq = int(d["seq"])
+            stream_seq = d["seq"]
         except Exception as e:
             self._log.error("STREAM_DECODE_FAILED err=%s", e)
             return
@@ -387,29 +429,26 @@ class DeviceSession:
             return
         # Decode payload into channels
         try:
-            base = sensor_meta.decode_payload(payload, compute=True, source="stream", stream_seq=stream_seq)
-
-            # Attach stream metadata
-            reading = replace(
-                base,
+            # Stream metadata is attached by decode_payload itself
+            reading = sensor_meta.decode_payload(
+                payload,
+                compute=True,
                 source="stream",
                 stream_seq=stream_seq,
-                cmd_seq=None,
                 capture_ts=capture_ts,
                 is_buffered=is_buffered,
             )
-
         except Exception as e:
             self._set_sensor_state(runtime_id, last_error=f"decode_failed: {e}")
             return
 
-        # Deliver to subscribers
-        with self._lock:
-            cbs = list(self._reading_cbs)
-
-        self._mark_mcu_ok()
+        # Deliver to subscribers; liveness is stamped at most every 50 ms while streaming
+        now_ns = time.monotonic_ns()
+        if now_ns - self._stream_mark_ns >= _STREAM_MARK_INTERVAL_NS:
+            self._stream_mark_ns = now_ns
+            self._mark_mcu_ok()
 
-        for cb in cbs:
+        for cb in self._reading_cbs:
             try:
                 cb(runtime_id, reading)
             except Exception:
@@ -428,14 +467,17 @@ class DeviceSession:
             if not st:
                 return
 
-            self._sensors[runtime_id] = SensorState(
-                runtime_id=st.runtime_id,
-                type_id=st.type_id,
-                name=st.name,
+            new = replace(
+                st,
                 streaming=st.streaming if streaming is None else streaming,
                 period_ms=st.period_ms if period_ms is None else period_ms,
                 last_error=last_error,
             )
+            if new == st:
+                return
+
+            self._sensors[runtime_id] = new
+            self._sensors_view = None
 
     def _mark_mcu_ok(self) -> None:
         with self._lock:
@@ -443,16 +485,14 @@ class DeviceSession:
             self._mcu_last_error = None
 
     def _require_client(self) -> McuClient:
-        with self._lock:
-            client = self._client
+        # Single attribute read, atomic under the GIL; start()/stop() write
+        # _client under the lock.
+        client = self._client
         if client is None:
             raise RuntimeError("DeviceSession not started (client is None)")
         return client
 
     def _resolve_sensor_meta(self, runtime_id: int) -> Optional[Sensor]:
-        with self._lock:
-            type_id = self._runtime_to_type.get(runtime_id)
-        if type_id is None:
-            return None
-        return self._sensors_catalog.get(int(type_id))
+        # Single lookup; the map is replaced, never mutated, so no lock needed
+        return self._runtime_to_sensor.get(runtime_id)
 
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -47,5 +47,5 @@ class SessionStatus:
     """
     transport: TransportState
     mcu: McuState
-    sensors: List[SensorState]
+    sensors: Sequence[SensorState]
     board_uid_hex: Optional[str] = None
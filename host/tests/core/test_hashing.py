@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+import host.core.hashing as hashing_mod
+from host.core.hashing import clear_digest_cache, sha256_file
+
+
+def test_sha256_file_matches_hashlib(tmp_path: Path) -> None:
+    p = tmp_path / "a.yml"
+    p.write_bytes(b"frames: {}\n")
+
+    assert sha256_file(p) == hashlib.sha256(b"frames: {}\n").hexdigest()
+
+
+def test_sha256_file_empty_file(tmp_path: Path) -> None:
+    p = tmp_path / "empty.yml"
+    p.write_bytes(b"")
+
+    assert sha256_file(p) == hashlib.sha256(b"").hexdigest()
+
+
+def test_sha256_file_memoizes_until_stat_changes(tmp_path: Path, monkeypatch) -> None:
+    clear_digest_cache()
+    p = tmp_path / "b.yml"
+    p.write_bytes(b"v1")
+
+    first = sha256_file(p)
+
+    calls = []
+    real_sha256 = hashing_mod.hashlib.sha256
+    monkeypatch.setattr(hashing_mod.hashlib, "sha256", lambda: calls.append(1) or real_sha256())
+
+    assert sha256_file(p) == first
+    assert calls == []
+
+    p.write_bytes(b"v2-longer")
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert sha256_file(p) == real_sha256(b"v2-longer").hexdigest()
+    assert calls == [1]
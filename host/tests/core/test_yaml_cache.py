@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import host.core.yaml_cache as yc_mod
+from host.core.yaml_cache import clear_yaml_cache, load_yaml_file
+
+
+def test_load_yaml_file_parses_document(tmp_path: Path) -> None:
+    p = tmp_path / "a.yml"
+    p.write_text("frames:\n  ACK: {code: 0x20}\n", encoding="utf-8")
+
+    assert load_yaml_file(p) == {"frames": {"ACK": {"code": 0x20}}}
+
+
+def test_load_yaml_file_empty_returns_none(tmp_path: Path) -> None:
+    p = tmp_path / "empty.yml"
+    p.write_text("", encoding="utf-8")
+
+    assert load_yaml_file(p) is None
+
+
+def test_load_yaml_file_memoizes_by_content_and_returns_copies(tmp_path: Path, monkeypatch) -> None:
+    clear_yaml_cache()
+    p = tmp_path / "b.yml"
+    p.write_text("x: [1, 2]\n", encoding="utf-8")
+
+    calls = []
+    real_load = yc_mod.yaml.load
+    monkeypatch.setattr(yc_mod.yaml, "load", lambda *a, **k: calls.append(1) or real_load(*a, **k))
+
+    first = load_yaml_file(p)
+    first["x"].append(3)  # callers may mutate their copy
+
+    assert load_yaml_file(p) == {"x": [1, 2]}
+    assert calls == [1]
+
+    p.write_text("x: [9]\n", encoding="utf-8")
+    assert load_yaml_file(p) == {"x": [9]}
+    assert calls == [1, 1]
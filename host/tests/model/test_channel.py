@@ -151,3 +151,13 @@ def test_evaluate_computed_dep_missing_requested_field_raises():
     )
     with pytest.raises(ValueError):
         ch.evaluate_computed(deps)
+
+
+def test_unpack_from_reads_at_offset_without_slicing():
+    ch = Channel(channel_id=1, name="v", encode="uint16", endian="little")
+    buf = memoryview(b"\xFF\x34\x12\xFF")
+    assert ch.unpack_from is not None
+    assert ch.unpack_from(buf, 1) == (0x1234,)
+
+    computed = Channel(channel_id=2, name="p", is_measured=False, compute={"operation": "add", "channels": [1]})
+    assert computed.unpack_from is None
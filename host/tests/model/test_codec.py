@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 import pytest
 
-from host.model.codec import decode_primitive, primitive_size
+from host.model.codec import decode_primitive, decode_primitive_into, get_codec, primitive_size
 
 
 def test_primitive_size_known_types():
@@ -42,3 +42,17 @@ def test_decode_wrong_size_raises():
 def test_decode_unknown_encode_raises():
     with pytest.raises(NotImplementedError):
         decode_primitive("nope", b"\x00", endian="little")
+
+
+def test_get_codec_is_case_insensitive_and_cached():
+    assert get_codec("UINT16") is get_codec("uint16")
+    assert get_codec("uint16").st_le.unpack(b"\x34\x12")[0] == 0x1234
+    assert get_codec("uint16").struct_for("big").unpack(b"\x12\x34")[0] == 0x1234
+
+
+def test_decode_primitive_into_walks_buffer_at_offsets():
+    buf = b"\x34\x12" + b"\x00\x00\x80\x3F"
+    assert decode_primitive_into("uint16", buf, 0) == 0x1234
+    assert decode_primitive_into("float", memoryview(buf), 2) == 1.0
+    with pytest.raises(ValueError):
+        decode_primitive_into("uint32", buf, 4)
@@ -5,6 +5,8 @@ import textwrap
 
 import pytest
 
+import host.core.yaml_cache as yc_mod
+from host.core.yaml_cache import clear_yaml_cache
 from host.model.loader import MetadataLoader
 
 
@@ -157,3 +159,32 @@ def test_load_sensors_measured_channel_requires_encode(tmp_path: Path) -> None:
     loader = MetadataLoader(tmp_path)
     with pytest.raises(ValueError):
         loader.load_all()
+
+
+def test_load_all_reuses_parsed_yaml_for_unchanged_files(tmp_path: Path, monkeypatch) -> None:
+    clear_yaml_cache()
+    _write(tmp_path, "transports.yml", "transports: {}\n")
+    _write(
+        tmp_path,
+        "sensors.yml",
+        """
+        sensors:
+          1:
+            name: S
+            channels:
+              1: {name: V, is_measured: true, encode: uint8, display_unit: V}
+        """,
+    )
+
+    loader = MetadataLoader(tmp_path)
+    loader.load_all()
+    first = loader.get_sensor(1)
+
+    calls = []
+    real_load = yc_mod.yaml.load
+    monkeypatch.setattr(yc_mod.yaml, "load", lambda *a, **k: calls.append(1) or real_load(*a, **k))
+
+    loader.load_all()
+
+    assert calls == []
+    assert loader.get_sensor(1) is not first  # models are rebuilt, only parsing is skipped
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 
 from host.model.channel import Channel
@@ -89,6 +91,18 @@ def test_decode_payload_decodes_measured_and_applies_scale():
     assert r.computed == {}
 
 
+def test_decode_payload_attaches_reading_metadata():
+    a = Channel(channel_id=1, name="a", encode="uint8")
+    s = Sensor(type_id=1, name="s", channels=[a])
+    ts = datetime(2024, 1, 1)
+
+    r = s.decode_payload(b"\x01", source="stream_buffered", stream_seq=7, capture_ts=ts, is_buffered=True)
+
+    assert (r.source, r.stream_seq, r.cmd_seq) == ("stream_buffered", 7, None)
+    assert r.capture_ts is ts
+    assert r.is_buffered is True
+
+
 def test_compute_channels_supports_chaining():
     a = Channel(channel_id=1, name="a", encode="uint8", display_unit="u")
     b = Channel(channel_id=2, name="b", encode="uint8", display_unit="u")
@@ -115,3 +129,19 @@ def test_compute_channels_supports_chaining():
     assert r.computed[10].raw == 7.0
     assert r.computed[11].raw == 14.0
     assert 10 in r.all and 11 in r.all
+
+
+def test_as_dict_returns_independent_copies_and_tracks_add_channel():
+    a = Channel(channel_id=1, name="a", encode="uint8")
+    s = Sensor(type_id=1, name="s", channels=[a])
+
+    d1 = s.as_dict()
+    assert list(d1["channels"]) == [1]
+    d1["name"] = "mutated"
+    d1["channels"][1]["scale"] = 99.0
+
+    assert s.as_dict()["name"] == "s"
+    assert s.as_dict()["channels"][1]["scale"] == 1.0
+
+    s.add_channel(Channel(channel_id=2, name="b", encode="uint8"))
+    assert list(s.as_dict()["channels"]) == [1, 2]
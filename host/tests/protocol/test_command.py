@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import struct
 import pytest
 
@@ -8,8 +9,11 @@ import host.protocol.core.frames.command as cmd_mod
 
 class FakeProto:
     def __init__(self):
-        self.constants = {"cmd_none": 0, "max_payload": 64}
-        self.frames = {"CMD": {"code": 0x01, "min_payload": 0, "max_payload": 8}}
+        self.cmd_none = 0
+        self.frames = {"CMD": {"code": 0x01}}
+        # frame code -> (min_payload, max_payload)
+        self.payload_bounds = {0x01: (0, 8)}
+        self.payload_plans = {}
         self._cmd_defs = {}
 
     def get_command_def(self, cmd_name: str) -> dict:
@@ -21,7 +25,7 @@ class FakeProto:
 
 def test_next_seq_increments_and_never_returns_zero(monkeypatch):
     # Force a wrap scenario
-    cmd_mod.CommandFrame._seq_counter = 0xFFFFFFFF
+    monkeypatch.setattr(cmd_mod.CommandFrame, "_seq_iter", itertools.count(0xFFFFFFFF))
 
     s1 = cmd_mod.CommandFrame.next_seq()
     s2 = cmd_mod.CommandFrame.next_seq()
@@ -87,8 +91,7 @@ def test_build_payload_unknown_type_raises(monkeypatch):
 
 def test_build_payload_enforces_cmd_frame_payload_bounds(monkeypatch):
     proto = FakeProto()
-    proto.frames["CMD"]["min_payload"] = 2
-    proto.frames["CMD"]["max_payload"] = 2
+    proto.payload_bounds[0x01] = (2, 2)
 
     proto._cmd_defs["SET"] = {
         "cmd_id": 7,
@@ -99,3 +102,20 @@ def test_build_payload_enforces_cmd_frame_payload_bounds(monkeypatch):
 
     with pytest.raises(ValueError):
         cmd_mod.CommandFrame.build_payload(proto, "SET", args={"a": 1})
+
+
+def test_build_payload_caches_plan_on_proto(monkeypatch):
+    proto = FakeProto()
+    proto._cmd_defs["SET"] = {
+        "cmd_id": 7,
+        "payload": [{"name": "a", "type": "u8"}, {"name": "b", "type": "u16"}],
+    }
+
+    monkeypatch.setattr(cmd_mod, "YAML_TO_STRUCT", {"u8": "B", "u16": "H"}, raising=False)
+
+    assert cmd_mod.CommandFrame.build_payload(proto, "SET", {"a": 1, "b": 2}) == struct.pack("<BH", 1, 2)
+    assert "SET" in proto.payload_plans
+
+    # second call is served from the cached plan
+    del proto._cmd_defs["SET"]
+    assert cmd_mod.CommandFrame.build_payload(proto, "SET", {"a": 3, "b": 4}) == struct.pack("<BH", 3, 4)
@@ -2,45 +2,47 @@ from __future__ import annotations
 
 import pytest
 
-from host.protocol.core.crc import crc16
+from host.protocol.core.crc import make_crc16
 
 
-class FakeProto:
-    def __init__(self, *, seed=0xFFFF, poly=0x1021):
-        self.constants = {
-            "crc": {
-                "seed": seed,
-                "poly": poly,
-            }
-        }
+def test_make_crc16_empty_buffer_returns_seed():
+    assert make_crc16(0xABCD, 0x1021)(b"") == 0xABCD
 
 
-def test_crc16_empty_buffer_returns_seed():
-    proto = FakeProto(seed=0xABCD)
-    assert crc16(proto, b"") == 0xABCD
-
-
-def test_crc16_known_ccitt_vector():
+def test_make_crc16_known_ccitt_vector():
     """
     CRC-16/CCITT-FALSE
     poly=0x1021, seed=0xFFFF
     ASCII "123456789" -> 0x29B1
     """
-    proto = FakeProto(seed=0xFFFF, poly=0x1021)
-    assert crc16(proto, b"123456789") == 0x29B1
-
+    assert make_crc16(0xFFFF, 0x1021)(b"123456789") == 0x29B1
 
-def test_crc16_different_seed_changes_result():
-    proto1 = FakeProto(seed=0xFFFF, poly=0x1021)
-    proto2 = FakeProto(seed=0x0000, poly=0x1021)
 
+def test_make_crc16_different_seed_changes_result():
     data = b"\x01\x02\x03"
-    assert crc16(proto1, data) != crc16(proto2, data)
+    assert make_crc16(0xFFFF, 0x1021)(data) != make_crc16(0x0000, 0x1021)(data)
 
 
-def test_crc16_different_poly_changes_result():
-    proto1 = FakeProto(seed=0xFFFF, poly=0x1021)
-    proto2 = FakeProto(seed=0xFFFF, poly=0x8005)
-
+def test_make_crc16_different_poly_changes_result():
     data = b"\x10\x20\x30"
-    assert crc16(proto1, data) != crc16(proto2, data)
+    assert make_crc16(0xFFFF, 0x1021)(data) != make_crc16(0xFFFF, 0x8005)(data)
+
+
+def _crc16_bitwise(seed: int, poly: int, buf: bytes) -> int:
+    crc = seed
+    for b in buf:
+        crc ^= b << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) & 0xFFFF if (crc & 0x8000) else ((crc << 1) & 0xFFFF)
+    return crc
+
+
+@pytest.mark.parametrize("seed,poly", [(0xFFFF, 0x1021), (0x0000, 0x8005), (0x1D0F, 0x3D65)])
+def test_make_crc16_matches_bitwise_reference(seed, poly):
+    data = bytes(range(256)) + b"\x5A\xA5" * 40
+    assert make_crc16(seed, poly)(data) == _crc16_bitwise(seed, poly, data)
+
+
+def test_make_crc16_ccitt_fast_path_accepts_memoryview():
+    data = bytearray(b"\x00123456789")
+    assert make_crc16(0xFFFF, 0x1021)(memoryview(data)[1:]) == 0x29B1
@@ -33,12 +33,44 @@ def test_protocol_builds_header_struct_and_lookup_maps(monkeypatch):
     assert p.header_fields == ["magic", "type", "len"]
     assert p.header_fmt == "<HBB".replace(" ", "")
     assert isinstance(p.header_struct, struct.Struct)
+    assert p.header_size == 4
+    assert (p.magic, p.max_payload, p.cmd_none) == (0xABCD, 8, 0)
+    assert p.crc16(b"123456789") == 0x29B1  # CCITT-FALSE defaults
+    assert p.header_unpack_from(b"\xcd\xab\x20\x01") == (0xABCD, 0x20, 1)
 
     assert p.frames_by_code[p.frames["ACK"]["code"]]["code"] == 0x20
+    assert p.frame_name_by_code == {0x20: "ACK", 0x21: "NACK"}
     assert p.error_codes[255] == "UNKNOWN"
     assert p.error_codes[1] == "BAD_CMD"
 
 
+def test_protocol_builds_response_ctor_table(monkeypatch):
+    from host.protocol.core.frames.response import AckFrame, NackFrame
+
+    monkeypatch.setattr(defs_mod, "YAML_TO_STRUCT", {"u16": "H", "u8": "B"}, raising=False)
+    p = defs_mod.Protocol(FakeLoader())
+
+    assert p.response_ctors == {0x20: AckFrame, 0x21: NackFrame}
+
+
+def test_protocol_header_codec_round_trip(monkeypatch):
+    monkeypatch.setattr(defs_mod, "YAML_TO_STRUCT", {"u16": "H", "u8": "B"}, raising=False)
+    p = defs_mod.Protocol(FakeLoader())
+    fields = {"magic": 0xABCD, "type": 0x20, "len": 1}
+
+    raw = p.build_header(fields)
+    buf = bytearray(6)
+    p.build_header_into(buf, fields, offset=2)
+
+    assert bytes(buf[2:]) == raw
+    assert p.parse_header(memoryview(raw)) == fields
+    assert p.unpack_header(raw + b"\xff\xff") == fields  # trailing bytes ignored
+    with pytest.raises(ValueError):
+        p.parse_header(raw[:-1])
+    with pytest.raises(KeyError):
+        p.build_header({"magic": 0xABCD})
+
+
 def test_protocol_rejects_unknown_header_field_type(monkeypatch):
     loader = FakeLoader()
     loader.header = [{"name": "magic", "type": "nope"}]
@@ -75,6 +107,16 @@ def test_validate_payload_len_checks_bounds(monkeypatch):
     assert p.validate_payload_len(0x99, 0) is False
 
 
+def test_payload_bounds_resolved_once_per_frame_code(monkeypatch):
+    monkeypatch.setattr(defs_mod, "YAML_TO_STRUCT", {"u16": "H", "u8": "B"}, raising=False)
+
+    loader = FakeLoader()
+    loader.frames["STREAM"] = {"code": 0x10, "min_payload": 1, "max_payload": "constants:max_payload"}
+    p = defs_mod.Protocol(loader)
+
+    assert p.payload_bounds == {0x20: (0, 2), 0x21: (0, 2), 0x10: (1, 8)}
+
+
 def test_get_command_def_unknown_raises(monkeypatch):
     monkeypatch.setattr(defs_mod, "YAML_TO_STRUCT", {"u16": "H", "u8": "B"}, raising=False)
 
@@ -39,7 +39,7 @@ class FakeProto:
             "ACK": {"code": 0x20},
             "NACK": {"code": 0x21},
         }
-        self.constants = {"cmd_none": 0}
+        self.cmd_none = 0
 
     def get_command_def(self, cmd_name: str) -> dict:
         return {"cmd_id": 1}
@@ -204,6 +204,18 @@ def test_pump_rx_stream_callback_error_does_not_crash(monkeypatch):
     engine._pump_rx()
 
 
+def test_handle_stream_logs_count_every_1024_frames(monkeypatch, caplog):
+    engine, _, _, _ = _make_engine(monkeypatch)
+    frame = SimpleNamespace(frame_type=0x10, seq=1, payload=b"\x01")
+
+    with caplog.at_level(logging.DEBUG, logger="test"):
+        for _ in range(2048):
+            engine._handle_stream(frame)
+
+    msgs = [r.getMessage() for r in caplog.records if r.getMessage().startswith("STREAM_RX")]
+    assert msgs == ["STREAM_RX count=1024", "STREAM_RX count=2048"]
+
+
 def test_pump_rx_expires_pending_by_timeout(monkeypatch):
     """
     Algorithm: Pending commands older than timeout_s must be marked 'timeout'
@@ -216,7 +228,7 @@ def test_pump_rx_expires_pending_by_timeout(monkeypatch):
 
     # created_at far in the past so it expires
     pending = FakePending(seq=42, cmd_name="GET_SENSORS", timeout_s=1.0, created_at=0.0)
-    engine._pending[42] = pending
+    engine._track_pending(pending)
 
     engine._pump_rx()
 
@@ -224,6 +236,48 @@ def test_pump_rx_expires_pending_by_timeout(monkeypatch):
     assert 42 not in engine._pending
 
 
+def test_pump_rx_expiry_skips_answered_and_unexpired(monkeypatch):
+    """
+    Algorithm: expiry only visits heap entries past their deadline; commands
+    already answered are skipped, later deadlines stay scheduled.
+    """
+    ack_frame = SimpleNamespace(frame_type=0x20, seq=1, payload=b"")
+    engine, _, _, _ = _make_engine(monkeypatch, parser_frames=[ack_frame])
+    monkeypatch.setattr(eng_mod.time, "perf_counter", lambda: 100.0)
+
+    answered = FakePending(seq=1, cmd_name="PING", timeout_s=1.0, created_at=0.0)
+    expired = FakePending(seq=2, cmd_name="PING", timeout_s=1.0, created_at=50.0)
+    live = FakePending(seq=3, cmd_name="PING", timeout_s=1.0, created_at=99.5)
+    for p in (answered, expired, live):
+        engine._track_pending(p)
+
+    engine._pump_rx()
+
+    assert answered.result_calls == [(ack_frame, "ok")]
+    assert expired.result_calls == [(None, "timeout")]
+    assert live.result_calls == []
+    assert list(engine._pending) == [3]
+    assert engine._expiry_heap == [(100.5, 3)]
+
+
+def test_pump_rx_read_size_follows_bytes_available(monkeypatch):
+    """
+    Algorithm: reads default to 256 bytes; if the transport reports buffered
+    bytes, exactly that backlog is drained in one read (capped at 64 KiB).
+    """
+    engine, _, transport, _ = _make_engine(monkeypatch, parser_frames=[])
+    sizes: list[int] = []
+    transport.read = lambda size: sizes.append(size) or b""
+
+    engine._pump_rx()  # no bytes_available on the transport
+
+    for avail in (0, 10, 1000, 1 << 20):
+        engine._bytes_available = lambda avail=avail: avail
+        engine._pump_rx()
+
+    assert sizes == [256, 256, 10, 1000, 65536]
+
+
 def test_decode_response_falls_back_to_raw_on_decode_error(monkeypatch):
     """
     Contract: if proto decode throws, _decode_response returns {'raw': hex}.
@@ -256,7 +310,7 @@ def test_send_cmd_async_send_failure_removes_pending_and_sets_send_failed(monkey
 
     created = {}
 
-    def _pending_factory(seq, cmd_name, timeout_s):
+    def _pending_factory(seq, cmd_name, timeout_s, **_codes):
         p = FakePending(seq=seq, cmd_name=cmd_name, timeout_s=timeout_s)
         created["pending"] = p
         return p
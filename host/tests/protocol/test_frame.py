@@ -8,20 +8,19 @@ from host.protocol.core.frames.base import Frame
 
 class FakeProto:
     def __init__(self):
-        self.constants = {"cmd_none": 0, "magic": 0xABCD, "max_payload": 16}
-        self.frames = {"ACK": {"code": 0x20}}
-        self.frames_by_code = {
-            0x20: {"min_payload": 0, "max_payload": 4},
-        }
+        self.magic = 0xABCD
+        self.cmd_none = 0
+        self.frame_name_by_code = {0x20: "ACK"}
+        self.payload_bounds = {0x20: (0, 4)}  # code -> (min_payload, max_payload)
+        # 2B magic + 1B type + 1B ver + 2B len + 4B seq + 4B ts + 1B cmd_id + 1B rsv = 16 bytes
+        self.header_struct = struct.Struct("<HBBHIIBB")
 
     def resolve_value(self, v, default=0):
         return v if v is not None else default
 
-    def build_header(self, hdr_dict: dict) -> bytes:
+    def _header_values(self, hdr_dict: dict) -> tuple:
         # Minimal deterministic header (doesn't have to match real wire format)
-        # 2B magic + 1B type + 1B ver + 2B len + 4B seq + 4B ts + 1B cmd_id + 1B rsv = 16 bytes
-        return struct.pack(
-            "<HBBHII BB",
+        return (
             hdr_dict["magic"],
             hdr_dict["type"],
             hdr_dict["ver"],
@@ -32,6 +31,12 @@ class FakeProto:
             hdr_dict["rsv"] & 0xFF,
         )
 
+    def build_header(self, hdr_dict: dict) -> bytes:
+        return self.header_struct.pack(*self._header_values(hdr_dict))
+
+    def build_header_into(self, buf, hdr_dict: dict, offset: int = 0) -> None:
+        self.header_struct.pack_into(buf, offset, *self._header_values(hdr_dict))
+
     def crc16(self, data: bytes) -> int:
         # Deterministic CRC stub for testing composition
         return 0xBEEF
@@ -45,7 +50,7 @@ def test_unknown_frame_type_raises():
 
 def test_payload_too_short_raises():
     proto = FakeProto()
-    proto.frames_by_code[0x20] = {"min_payload": 2, "max_payload": 4}
+    proto.payload_bounds[0x20] = (2, 4)
     with pytest.raises(ValueError):
         Frame(proto=proto, frame_type=0x20, seq=1, payload=b"\x00")
 
@@ -62,7 +67,7 @@ def test_defaults_cmd_id_and_masks_ts_ms_and_seq():
 
     assert f.seq == 1
     assert f.ts_ms == 2
-    assert f.cmd_id == proto.constants["cmd_none"]
+    assert f.cmd_id == proto.cmd_none
 
 
 def test_encode_appends_crc_and_uses_proto_build_header():
@@ -79,7 +84,7 @@ def test_encode_appends_crc_and_uses_proto_build_header():
     header = raw[:-2 - len(payload)]
     assert header == proto.build_header(
         {
-            "magic": proto.constants["magic"],
+            "magic": proto.magic,
             "type": 0x20,
             "ver": 0,
             "len": len(payload),
@@ -94,11 +99,24 @@ def test_encode_appends_crc_and_uses_proto_build_header():
     assert raw[len(header) : len(header) + len(payload)] == payload
 
 
+def test_encode_reuses_scratch_without_leaking_previous_frame():
+    proto = FakeProto()
+    long_raw = Frame(proto=proto, frame_type=0x20, seq=1, payload=b"\x11\x22\x33\x44", ts_ms=1).encode()
+    short_raw = Frame(proto=proto, frame_type=0x20, seq=2, payload=b"\x55", ts_ms=2).encode()
+
+    hdr_size = proto.header_struct.size
+    assert len(long_raw) == hdr_size + 4 + 2
+    assert len(short_raw) == hdr_size + 1 + 2
+    assert short_raw[hdr_size:] == b"\x55" + struct.pack("<H", 0xBEEF)
+    # returned frames are independent copies
+    assert long_raw[hdr_size : hdr_size + 4] == b"\x11\x22\x33\x44"
+
+
 def test_type_name_matches_frames_mapping_and_falls_back():
     proto = FakeProto()
     f = Frame(proto=proto, frame_type=0x20, seq=1, payload=b"")
     assert f.type_name == "ACK"
 
     f2 = Frame(proto=proto, frame_type=0x20, seq=2, payload=b"")
-    proto.frames = {}  # remove mapping
+    proto.frame_name_by_code = {}  # remove mapping
     assert f2.type_name == "TYPE_32"
@@ -2,16 +2,32 @@ from __future__ import annotations
 
 import pytest
 
+from host.protocol.errors import CommandFailed, CommandTimeout
 from host.protocol.mcu_client import McuClient
 
 
 class FakeEngine:
+    cmd_timeout_s = 1.0
+
     def __init__(self, responses: dict[str, dict]):
         self._responses = responses
+        self.events: list[str] = []
 
     def send_cmd(self, cmd_name: str, **_kwargs):
+        self.events.append(f"cmd:{cmd_name}")
         return dict(self._responses[cmd_name])
 
+    def send_cmd_async(self, cmd_name: str, **_kwargs):
+        self.events.append(f"send:{cmd_name}")
+        engine = self
+
+        class _Handle:
+            def wait(self, timeout=None):
+                engine.events.append(f"wait:{cmd_name}")
+                return dict(engine._responses[cmd_name])
+
+        return _Handle()
+
 
 def test_get_uptime_uses_payload_field():
     engine = FakeEngine({"GET_UPTIME": {"status": "ok", "payload": {"uptime_ms": 12345}}})
@@ -73,3 +89,38 @@ def test_get_board_uid_hex_missing_fields_raises():
     client = McuClient(engine)  # type: ignore[arg-type]
     with pytest.raises(RuntimeError, match="missing"):
         client.get_board_uid_hex()
+
+
+def test_set_period_and_start_sends_both_before_waiting():
+    engine = FakeEngine({"SET_PERIOD": {"status": "ok"}, "START_STREAM": {"status": "ok"}})
+    client = McuClient(engine)  # type: ignore[arg-type]
+
+    client.set_period_and_start(2, period_ms=100)
+
+    assert engine.events == ["send:SET_PERIOD", "send:START_STREAM", "wait:SET_PERIOD", "wait:START_STREAM"]
+
+
+def test_set_period_and_start_stops_stream_when_set_period_fails():
+    engine = FakeEngine(
+        {
+            "SET_PERIOD": {"status": "nack"},
+            "START_STREAM": {"status": "ok"},
+            "STOP_STREAM": {"status": "ok"},
+        }
+    )
+    client = McuClient(engine)  # type: ignore[arg-type]
+
+    with pytest.raises(CommandFailed):
+        client.set_period_and_start(2, period_ms=100)
+
+    assert engine.events[-2:] == ["wait:START_STREAM", "cmd:STOP_STREAM"]
+
+
+def test_set_period_and_start_timeout_without_started_stream_skips_stop():
+    engine = FakeEngine({"SET_PERIOD": {"status": "timeout"}, "START_STREAM": {"status": "timeout"}})
+    client = McuClient(engine)  # type: ignore[arg-type]
+
+    with pytest.raises(CommandTimeout):
+        client.set_period_and_start(2, period_ms=100)
+
+    assert "cmd:STOP_STREAM" not in engine.events
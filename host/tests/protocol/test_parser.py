@@ -29,39 +29,36 @@ class _FakeResponseFrame:
         self._hdr = {}
 
     @classmethod
-    def from_bytes(cls, proto, hdr_bytes: bytes, payload: bytes):
+    def from_bytes(cls, proto, hdr_bytes: bytes, payload: bytes, hdr=None):
         f = cls()
         f.payload = payload
+        f.parsed_hdr = hdr
         return f
 
 
 class FakeProtocol:
     def __init__(self):
         self.header_struct = _HdrStruct(size=8)
-        self.constants = {
-            "magic": 0xABCD,
-            "max_payload": 16,
-            "cmd_none": 0,
-        }
+        self.magic = 0xABCD
+        self.max_payload = 16
+        self.cmd_none = 0
         self.frames = {"STREAM": {"code": 0x10}}
+        # frame code -> (min_payload, max_payload)
+        self.payload_bounds = {0x01: (0, 16), 0x10: (0, 16), 0x22: (0, 16)}
 
         self._crc_expected = None
-        self._validate_ok = True
         self._parse_header_impl = None
 
-    def parse_header(self, hdr_bytes: bytes) -> dict:
+    def unpack_header(self, buf) -> dict:
         if self._parse_header_impl:
-            return self._parse_header_impl(hdr_bytes)
-        raise RuntimeError("parse_header not configured")
+            return self._parse_header_impl(bytes(buf[: self.header_struct.size]))
+        raise RuntimeError("unpack_header not configured")
 
     def crc16(self, data: bytes) -> int:
         if self._crc_expected is None:
             raise RuntimeError("crc16 not configured")
         return self._crc_expected
 
-    def validate_payload_len(self, ftype: int, payload_len: int) -> bool:
-        return self._validate_ok
-
 
 def _build_frame_bytes(
     *,
@@ -97,6 +94,22 @@ def test_sync_magic_discards_bytes_before_magic():
     assert bytes(parser.buffer[:2]) == (0xABCD).to_bytes(2, "little")
 
 
+def test_sync_magic_drops_garbage_but_keeps_possible_magic_prefix():
+    proto = FakeProtocol()
+    parser = parser_mod.FrameParser(proto)
+
+    magic = (0xABCD).to_bytes(2, "little")
+    parser.feed(b"\x00" * 20 + magic[:1])
+    assert parser.get_frame() is None
+    assert bytes(parser.buffer) == magic[:1]
+
+    # second half of the magic arrives later
+    parser.feed(magic[1:] + b"\x00" * (proto.header_struct.size - 2))
+    proto._parse_header_impl = lambda hb: {"type": 1, "seq": 1, "len": 1, "ts_ms": 0, "cmd_id": 0, "rsv": 0}
+    assert parser.get_frame() is None
+    assert bytes(parser.buffer[:2]) == magic
+
+
 def test_header_parse_failure_skips_two_bytes():
     proto = FakeProtocol()
     parser = parser_mod.FrameParser(proto)
@@ -115,7 +128,7 @@ def test_payload_too_large_skips_magic():
     proto = FakeProtocol()
     parser = parser_mod.FrameParser(proto)
 
-    proto._parse_header_impl = lambda hb: {"type": 1, "seq": 1, "len": proto.constants["max_payload"] + 1, "ts_ms": 0}
+    proto._parse_header_impl = lambda hb: {"type": 1, "seq": 1, "len": proto.max_payload + 1, "ts_ms": 0}
     parser.feed((0xABCD).to_bytes(2, "little") + b"\x00" * (proto.header_struct.size - 2))
 
     before = bytes(parser.buffer)
@@ -137,7 +150,7 @@ def test_crc_mismatch_skips_magic():
 
     parser.feed(
         _build_frame_bytes(
-            magic=proto.constants["magic"],
+            magic=proto.magic,
             hdr_size=proto.header_struct.size,
             payload=payload,
             rx_crc=rx_crc,
@@ -148,7 +161,8 @@ def test_crc_mismatch_skips_magic():
     assert parser.get_frame() is None
     after = bytes(parser.buffer)
 
-    assert after == before[2:]
+    # magic skipped; the rest holds no magic, so only a possible prefix byte is kept
+    assert after == before[2:][-1:]
 
 
 def test_invalid_payload_len_drops_entire_frame():
@@ -158,12 +172,12 @@ def test_invalid_payload_len_drops_entire_frame():
     payload = b"\xAA\xBB"
     rx_crc = 0x2222
     proto._crc_expected = rx_crc
-    proto._validate_ok = False
+    proto.payload_bounds.clear()  # unknown frame type
 
     proto._parse_header_impl = lambda hb: {"type": 1, "seq": 9, "len": len(payload), "ts_ms": 0, "cmd_id": 0, "rsv": 0}
 
     raw = _build_frame_bytes(
-        magic=proto.constants["magic"],
+        magic=proto.magic,
         hdr_size=proto.header_struct.size,
         payload=payload,
         rx_crc=rx_crc,
@@ -174,6 +188,28 @@ def test_invalid_payload_len_drops_entire_frame():
     assert bytes(parser.buffer) == b""
 
 
+def test_payload_len_outside_bounds_drops_frame():
+    proto = FakeProtocol()
+    proto.payload_bounds = {1: (4, 8)}
+    parser = parser_mod.FrameParser(proto)
+
+    payload = b"\xAA\xBB"
+    proto._crc_expected = 0x2222
+    proto._parse_header_impl = lambda hb: {"type": 1, "seq": 9, "len": len(payload), "ts_ms": 0, "cmd_id": 0, "rsv": 0}
+
+    parser.feed(
+        _build_frame_bytes(
+            magic=proto.magic,
+            hdr_size=proto.header_struct.size,
+            payload=payload,
+            rx_crc=0x2222,
+        )
+    )
+
+    assert parser.get_frame() is None
+    assert bytes(parser.buffer) == b""
+
+
 def test_parses_stream_frame_and_clears_buffer(monkeypatch):
     proto = FakeProtocol()
     parser = parser_mod.FrameParser(proto)
@@ -184,7 +220,6 @@ def test_parses_stream_frame_and_clears_buffer(monkeypatch):
     payload = b"\x10\x20\x30"
     rx_crc = 0xBEEF
     proto._crc_expected = rx_crc
-    proto._validate_ok = True
 
     proto._parse_header_impl = lambda hb: {
         "type": proto.frames["STREAM"]["code"],
@@ -197,7 +232,7 @@ def test_parses_stream_frame_and_clears_buffer(monkeypatch):
 
     parser.feed(
         _build_frame_bytes(
-            magic=proto.constants["magic"],
+            magic=proto.magic,
             hdr_size=proto.header_struct.size,
             payload=payload,
             rx_crc=rx_crc,
@@ -208,6 +243,7 @@ def test_parses_stream_frame_and_clears_buffer(monkeypatch):
     assert isinstance(frame, _FakeStreamFrame)
     assert frame.seq == 3
     assert frame.payload == payload
+    assert type(frame.payload) is bytes  # owned copy, not a view into the buffer
     assert frame.ts_ms == 123
     assert frame.rsv == 5
     assert bytes(parser.buffer) == b""
@@ -223,7 +259,6 @@ def test_parses_response_frame_and_sets_cmd_id_rsv_and_diagnostics(monkeypatch):
     payload = b"\xDE\xAD"
     rx_crc = 0x4444
     proto._crc_expected = rx_crc
-    proto._validate_ok = True
 
     hdr_dict = {
         "type": 0x22,
@@ -236,7 +271,7 @@ def test_parses_response_frame_and_sets_cmd_id_rsv_and_diagnostics(monkeypatch):
     proto._parse_header_impl = lambda hb: dict(hdr_dict)
 
     raw = _build_frame_bytes(
-        magic=proto.constants["magic"],
+        magic=proto.magic,
         hdr_size=proto.header_struct.size,
         payload=payload,
         rx_crc=rx_crc,
@@ -249,4 +284,5 @@ def test_parses_response_frame_and_sets_cmd_id_rsv_and_diagnostics(monkeypatch):
     assert frame.rsv == 9
     assert frame._raw_header == raw[: proto.header_struct.size]
     assert frame._hdr == hdr_dict
+    assert frame.parsed_hdr is frame._hdr  # header parsed once, handed to from_bytes
     assert bytes(parser.buffer) == b""
@@ -35,6 +35,16 @@ def test_set_result_send_failed():
     assert p.wait(0) == {"status": "send_failed"}
 
 
+def test_set_result_timeout_results_are_independent():
+    a = PendingCommand(seq=1, cmd_name="PING", timeout_s=1.0)
+    b = PendingCommand(seq=2, cmd_name="PING", timeout_s=1.0)
+    a.set_result(None, "timeout")
+    b.set_result(None, "timeout")
+
+    a.wait(0)["extra"] = 1
+    assert b.wait(0) == {"status": "timeout"}
+
+
 def test_set_result_none_resp_unknown():
     p = PendingCommand(seq=1, cmd_name="PING", timeout_s=1.0)
     p.set_result(None, "ok")
@@ -71,6 +81,14 @@ def test_set_result_ack_decode_fn_applied_to_bytes():
     assert p.wait(0) == {"status": "ok", "payload": {"raw_sum": 3}}
 
 
+def test_set_result_ack_uses_decode_fn_bound_at_creation():
+    p = PendingCommand(seq=1, cmd_name="GET", timeout_s=1.0, decode_fn=lambda b: {"len": len(b)})
+    resp = FakeResp(frame_type=0x20, payload=b"\x01\x02\x03")
+
+    p.set_result(resp, "ok")
+    assert p.wait(0) == {"status": "ok", "payload": {"len": 3}}
+
+
 def test_set_result_ack_decode_fn_failure_returns_hex_raw():
     p = PendingCommand(seq=1, cmd_name="GET", timeout_s=1.0)
     resp = FakeResp(frame_type=0x20, payload=b"\xDE\xAD")
@@ -121,3 +139,10 @@ def test_set_result_is_idempotent_once_done():
     p.set_result(None, "timeout")
     p.set_result(None, "send_failed")  # should be ignored
     assert p.wait(0) == {"status": "timeout"}
+
+
+def test_set_result_uses_provided_frame_codes():
+    p = PendingCommand(seq=1, cmd_name="GET", timeout_s=1.0, ack_code=0x30, nack_code=0x31)
+    resp = FakeResp(frame_type=0x30, payload=b"\xAA", decoded={"x": 1})
+    p.set_result(resp, "ok")
+    assert p.wait(0) == {"status": "ok", "payload": {"x": 1}}
@@ -7,7 +7,8 @@ import host.protocol.core.frames.response as resp_mod
 
 class FakeProto:
     def __init__(self):
-        self.constants = {"cmd_none": 0}
+        self.magic = 0xABCD
+        self.cmd_none = 0
         self.frames = {
             "ACK": {"code": 0x20},
             "NACK": {"code": 0x21},
@@ -20,12 +21,9 @@ class FakeProto:
         self._decode_calls = []
 
         # Used by Frame._validate_payload_length in base class
-        self.frames_by_code = {
-            0x20: {"min_payload": 0, "max_payload": 64},
-            0x21: {"min_payload": 0, "max_payload": 64},
-            0x10: {"min_payload": 0, "max_payload": 64},
-            0x33: {"min_payload": 0, "max_payload": 64},
-        }
+        self.payload_bounds = {0x20: (0, 64), 0x21: (0, 64), 0x10: (0, 64), 0x33: (0, 64)}
+        self.frame_name_by_code = {0x20: "ACK", 0x21: "NACK", 0x10: "STREAM"}
+        self.response_ctors = {0x20: resp_mod.AckFrame, 0x21: resp_mod.NackFrame}
 
     def parse_header(self, raw_header: bytes) -> dict:
         assert self._hdr is not None
@@ -69,6 +67,20 @@ def test_ack_frame_decoded_calls_proto_decode_response():
     assert out == {"cmd_id": 12, "payload_len": 2, "seq": 1, "ts_ms": 1}
     assert proto._decode_calls == [(12, b"\x01\x02")]
 
+    # cached: repeated reads do not re-decode
+    assert f.decoded is out
+    assert len(proto._decode_calls) == 1
+
+
+def test_response_frame_from_bytes_uses_preparsed_header():
+    proto = FakeProto()
+    hdr = {"type": proto.frames["ACK"]["code"], "seq": 4, "ts_ms": 8, "cmd_id": 2, "rsv": 0}
+
+    # proto._hdr is unset: parse_header would fail if it were called
+    f = resp_mod.ResponseFrame.from_bytes(proto, raw_header=b"hdr", payload=b"", hdr=hdr)
+    assert isinstance(f, resp_mod.AckFrame)
+    assert f.seq == 4
+
 
 def test_response_frame_from_bytes_dispatches_nack():
     proto = FakeProto()
@@ -134,5 +146,33 @@ def test_stream_frame_splits_runtime_id_and_payload():
     assert f.decoded["seq"] == 1
     assert f.decoded["ts_ms"] == 10
     assert f.frame_type == proto.frames["STREAM"]["code"]
-    assert f.cmd_id == proto.constants["cmd_none"]
+    assert f.cmd_id == proto.cmd_none
     assert f.rsv == 3
+
+
+def test_stream_frame_decoded_is_cached_and_zero_copy():
+    proto = FakeProto()
+    f = resp_mod.StreamFrame(proto=proto, seq=1, payload=b"\x05\xAA\xBB", ts_ms=10)
+
+    d = f.decoded
+    assert f.decoded is d
+    assert isinstance(d["raw_readings"], memoryview)
+    assert d["raw_readings"].obj is f.payload
+
+
+def test_ack_decoded_matches_decoder_decode_response():
+    import host.protocol.core.decoder as dec_mod
+
+    proto = FakeProto()
+    proto.commands_by_id = {
+        4: {"response_payload": [{"name": "count", "type": "uint8"}, {"name": "period_ms", "type": "uint16"}]}
+    }
+    proto.decode_response = lambda cmd_id, payload: dec_mod.decode_response(proto, cmd_id, payload)
+    proto._hdr = {"type": proto.frames["ACK"]["code"], "seq": 3, "ts_ms": 50, "cmd_id": 4, "rsv": 0}
+
+    payload = b"\x02\xf4\x01"
+    f = resp_mod.ResponseFrame.from_bytes(proto, raw_header=b"hdr", payload=payload)
+
+    expected = dec_mod.decode_response(proto, 4, payload)
+    assert expected == {"count": 2, "period_ms": 500}
+    assert f.decoded == {**expected, "seq": 3, "ts_ms": 50}
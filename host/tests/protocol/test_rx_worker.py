@@ -49,3 +49,28 @@ def test_rx_worker_keeps_running():
 
     assert not w.is_alive()
     assert eng.calls >= 2
+
+
+def test_rx_worker_skips_backoff_while_data_arrives():
+    eng = FakeEngine()
+    waits = []
+
+    w = RxWorker(eng)
+    real_wait = w._stop_event.wait
+    w._stop_event.wait = lambda t=None: waits.append(t) or real_wait(t)
+
+    pumps = iter([True, True, False])
+
+    def _pump():
+        eng.calls += 1
+        got = next(pumps, None)
+        if got is None:
+            w.stop()
+            return True
+        return got
+
+    eng._pump_rx = _pump
+    w.run()
+
+    assert eng.calls == 4
+    assert waits == [0.001]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from host.protocol.errors import CommandFailed
+from host.runtime.device_session import DeviceSession
+from host.runtime.state import SensorState
+
+
+class FakeClient:
+    def __init__(self, error: Exception | None = None):
+        self.calls: list[tuple[int, int]] = []
+        self._error = error
+
+    def set_period_and_start(self, sensor_runtime_id: int, period_ms: int) -> None:
+        self.calls.append((sensor_runtime_id, period_ms))
+        if self._error is not None:
+            raise self._error
+
+
+def _session(client: FakeClient) -> DeviceSession:
+    session = DeviceSession(
+        proto=SimpleNamespace(),  # type: ignore[arg-type]
+        sensors={},
+        device_transport=SimpleNamespace(  # type: ignore[arg-type]
+            transport=SimpleNamespace(),
+            params={"port": "COM4"},
+            meta=SimpleNamespace(type_id=1, driver="uart", label="uart", key_param="port"),
+        ),
+    )
+    session._client = client  # type: ignore[assignment]
+    session._sensors = {2: SensorState(runtime_id=2, type_id=7, name="ina219")}
+    return session
+
+
+def test_configure_stream_marks_sensor_streaming_at_period():
+    client = FakeClient()
+    session = _session(client)
+
+    session.configure_stream(2, period_ms=100)
+
+    assert client.calls == [(2, 100)]
+    (st,) = session.status().sensors
+    assert st.streaming is True
+    assert st.period_ms == 100
+
+
+def test_configure_stream_failure_leaves_sensor_state_unchanged():
+    session = _session(FakeClient(error=CommandFailed("SET_PERIOD", {"status": "nack"})))
+
+    with pytest.raises(CommandFailed):
+        session.configure_stream(2, period_ms=100)
+
+    (st,) = session.status().sensors
+    assert st.streaming is False
+    assert st.period_ms is None
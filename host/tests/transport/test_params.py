@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import pytest
+
+from host.core.errors import TransportConfigError
+from host.model.transport import TransportType
+import host.transport.params as params_mod
+from host.transport.params import TransportParamResolver
+
+
+def _resolver() -> TransportParamResolver:
+    uart = TransportType(
+        1,
+        "uart",
+        "uart",
+        {
+            "port": {"type": "str", "required": True},
+            "baudrate": {"type": "int", "default": 115200},
+            "timeout": {"type": "float", "default": 0.1},
+        },
+    )
+    return TransportParamResolver({1: uart})
+
+
+def test_resolve_applies_defaults_and_overrides():
+    r = _resolver()
+
+    assert r.resolve(1, {"port": "COM3", "timeout": 1}) == {
+        "port": "COM3",
+        "baudrate": 115200,
+        "timeout": 1.0,
+    }
+
+
+def test_resolve_memoizes_and_returns_fresh_dicts(monkeypatch):
+    r = _resolver()
+    first = r.resolve(1, {"port": "COM3"})
+    first["port"] = "mutated"
+
+    calls = []
+    monkeypatch.setattr(r, "_resolve_from_meta", lambda *a: calls.append(1))
+
+    assert r.resolve(1, {"port": "COM3"}) == {"port": "COM3", "baudrate": 115200, "timeout": 0.1}
+    assert calls == []
+
+
+def test_resolve_cache_distinguishes_value_types():
+    r = _resolver()
+    assert r.resolve(1, {"port": "COM3", "baudrate": 1})["baudrate"] == 1
+
+    with pytest.raises(TransportConfigError):
+        r.resolve(1, {"port": "COM3", "baudrate": True})
+
+
+def test_resolve_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(params_mod, "_RESOLVED_MAX", 2)
+    r = _resolver()
+
+    r.resolve(1, {"port": "COM1"})
+    r.resolve(1, {"port": "COM2"})
+    r.resolve(1, {"port": "COM1"})  # hit: COM1 becomes most recent
+    r.resolve(1, {"port": "COM3"})  # evicts COM2
+
+    assert [cached["port"] for cached in r._resolved.values()] == ["COM1", "COM3"]
+
+
+def test_resolve_unhashable_override_is_not_cached():
+    r = _resolver()
+
+    with pytest.raises(TransportConfigError):
+        r.resolve(1, {"port": ["COM3"]})
+    assert r._resolved == {}
+
+
+def test_resolve_missing_required_raises():
+    with pytest.raises(TransportConfigError):
+        _resolver().resolve(1, {})
+
+
+def test_cast_param_dispatch():
+    cast = TransportParamResolver._cast_param
+
+    assert cast(None, "int") is None
+    assert cast(3, "float") == 3.0 and isinstance(cast(3, "float"), float)
+    assert cast(1, "bool") is True
+    with pytest.raises(TypeError):
+        cast(True, "int")
+    with pytest.raises(TypeError):
+        cast("x", "list[int]")
@@ -13,6 +13,7 @@ class FakeSerial:
         self.timeout = timeout
         self.write_timeout = write_timeout
         self.is_open = True
+        self.in_waiting = 0
 
         self._read_chunks = []
         self._write_ret = 0
@@ -72,6 +73,54 @@ def test_open_success_resets_buffers(monkeypatch):
     assert created["ser"].reset_out_called == 1
 
 
+def test_open_lowers_usb_serial_latency_timer(monkeypatch, tmp_path):
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: FakeSerial("/dev/ttyUSB0", 115200, 0.1, 0.1))
+    monkeypatch.setattr(uart_mod.sys, "platform", "linux")
+
+    written = {}
+
+    def fake_open(path, mode):
+        written["path"] = path
+        return open(tmp_path / "latency_timer", mode)
+
+    monkeypatch.setattr(uart_mod, "open", fake_open, raising=False)
+
+    uart_mod.UARTTransport("/dev/ttyUSB0").open()
+
+    assert written["path"] == "/sys/bus/usb-serial/devices/ttyUSB0/latency_timer"
+    assert (tmp_path / "latency_timer").read_bytes() == b"1"
+
+    written.clear()
+    uart_mod.UARTTransport("/dev/ttyUSB0", low_latency=False).open()
+    assert written == {}
+
+
+def test_open_ignores_missing_latency_timer(monkeypatch):
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: FakeSerial("/dev/ttyACM0", 115200, 0.1, 0.1))
+    monkeypatch.setattr(uart_mod.sys, "platform", "linux")
+
+    def fake_open(path, mode):
+        raise PermissionError(path)
+
+    monkeypatch.setattr(uart_mod, "open", fake_open, raising=False)
+
+    t = uart_mod.UARTTransport("/dev/ttyACM0")
+    t.open()
+    assert t.is_open() is True
+
+
+def test_open_without_flush_skips_buffer_resets(monkeypatch):
+    s = FakeSerial("COM5", 115200, 0.1, 0.1)
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = uart_mod.UARTTransport("COM5", low_latency=False, flush_on_open=False)
+    t.open()
+
+    assert t.is_open() is True
+    assert s.reset_in_called == 0
+    assert s.reset_out_called == 0
+
+
 def test_open_serial_exception_raises_transport_open_error(monkeypatch):
     def fake_serial_ctor(*a, **k):
         raise uart_mod.SerialException("no port")
@@ -115,6 +164,59 @@ def test_read_collects_until_n_or_timeout(monkeypatch):
     assert out == b"\x01\x02\x03"  # stopped early due to empty chunk
 
 
+def test_read_stops_collecting_at_deadline(monkeypatch):
+    s = FakeSerial("COM1", 115200, 0.05, 0.05)
+    s._read_chunks = [b"\x01", b"\x02", b"\x03", b"\x04"]  # one byte per timeout
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+    clock = iter([0.0, 0.03, 0.06, 0.09])
+    monkeypatch.setattr(uart_mod.time, "monotonic", lambda: next(clock))
+
+    t = uart_mod.UARTTransport("COM1", timeout=0.05)
+    t.open()
+
+    assert t.read(4) == b"\x01\x02"
+    assert s._read_chunks == [b"\x03", b"\x04"]
+
+
+def test_read_full_chunk_returns_after_single_call(monkeypatch):
+    s = FakeSerial("COM1", 115200, 0.05, 0.05)
+    s._read_chunks = [b"\x01\x02\x03", b"\x04"]
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = uart_mod.UARTTransport("COM1")
+    t.open()
+
+    assert t.read(3) == b"\x01\x02\x03"
+    assert s._read_chunks == [b"\x04"]  # no second read issued
+
+
+def test_read_sized_to_buffered_bytes_takes_one_call(monkeypatch):
+    s = FakeSerial("COM1", 115200, 0.05, 0.05)
+    s.in_waiting = 2
+    requested = []
+    s.read = lambda n: requested.append(n) or b"\x01\x02"
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = uart_mod.UARTTransport("COM1")
+    t.open()
+
+    assert t.read(t.bytes_available()) == b"\x01\x02"
+    assert requested == [2]
+
+
+def test_bytes_available_reports_in_waiting(monkeypatch):
+    s = FakeSerial("COM1", 115200, 0.05, 0.05)
+    s.in_waiting = 37
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = uart_mod.UARTTransport("COM1")
+    with pytest.raises(TransportIOError):
+        t.bytes_available()
+
+    t.open()
+    assert t.bytes_available() == 37
+
+
 def test_read_serial_exception_clears_ser_and_raises(monkeypatch):
     s = FakeSerial("COM1", 115200, 0.05, 0.05)
     s._raise_on_read = uart_mod.SerialException("read fail")
@@ -140,6 +242,31 @@ def test_write_returns_bytes_written(monkeypatch):
     assert t.write(b"abcd") == 4
 
 
+def test_write_all_retries_short_writes(monkeypatch):
+    s = FakeSerial("COM1", 115200, 0.05, 0.05)
+    chunks = []
+    s.write = lambda data: chunks.append(bytes(data)) or min(len(data), 3)
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = uart_mod.UARTTransport("COM1")
+    t.open()
+
+    assert t.write_all(b"abcdefgh") == 8
+    assert chunks == [b"abcdefgh", b"defgh", b"gh"]
+
+
+def test_write_all_stalled_raises(monkeypatch):
+    s = FakeSerial("COM1", 115200, 0.05, 0.05)
+    s._write_ret = 0
+    monkeypatch.setattr(uart_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = uart_mod.UARTTransport("COM1")
+    t.open()
+
+    with pytest.raises(TransportIOError):
+        t.write_all(b"abc")
+
+
 def test_write_serial_exception_clears_ser_and_raises(monkeypatch):
     s = FakeSerial("COM1", 115200, 0.05, 0.05)
     s._raise_on_write = uart_mod.SerialException("write fail")
@@ -13,6 +13,7 @@ class FakeSerial:
         self.timeout = timeout
         self.write_timeout = write_timeout
         self.is_open = True
+        self.in_waiting = 0
 
         self._read_chunks = []
         self._write_ret = 0
@@ -56,13 +57,26 @@ class FakeSerial:
         self.is_open = False
 
 
-def test_open_success_resets_buffers(monkeypatch):
-    s = FakeSerial("COM9", 115200, 1.0, 1.0)
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
+@pytest.fixture(autouse=True)
+def _fast_open(monkeypatch):
+    # Every test port is enumerated and open() never really sleeps
+    ports = [type("P", (), {"device": d})() for d in ("COM1", "COM9", "COM404")]
+    monkeypatch.setattr("serial.tools.list_ports.comports", lambda: ports)
     monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
 
-    t = usb_mod.USBTransport("COM9", assert_dtr=False)
+
+@pytest.fixture
+def opened_usb(monkeypatch):
+    s = FakeSerial("COM1", 115200, 1.0, 1.0)
+    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
+
+    t = usb_mod.USBTransport("COM1", assert_dtr=False)
     t.open()
+    return t, s
+
+
+def test_open_success_resets_buffers(opened_usb):
+    t, s = opened_usb
 
     assert t.ser is s
     assert s.reset_in_called == 1
@@ -89,6 +103,34 @@ def test_open_with_dtr_toggle_sets_lines_and_sleeps(monkeypatch):
     assert sleeps == [0.11, 0.22]
 
 
+def test_reopen_without_dtr_pulse_skips_post_reset_delay(monkeypatch):
+    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: FakeSerial("COM9", 115200, 1.0, 1.0))
+
+    sleeps = []
+    monkeypatch.setattr(usb_mod.time, "sleep", lambda t: sleeps.append(t))
+
+    t = usb_mod.USBTransport("COM9", assert_dtr=False, reset_delay_s=0.11, post_reset_delay_s=0.22)
+    t.open()
+    t.close()
+    t.open()
+
+    assert sleeps == [0.22]
+
+
+def test_reopen_with_dtr_pulse_waits_full_reset(monkeypatch):
+    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: FakeSerial("COM9", 115200, 1.0, 1.0))
+
+    sleeps = []
+    monkeypatch.setattr(usb_mod.time, "sleep", lambda t: sleeps.append(t))
+
+    t = usb_mod.USBTransport("COM9", assert_dtr=True, reset_delay_s=0.11, post_reset_delay_s=0.22)
+    t.open()
+    t.close()
+    t.open()
+
+    assert sleeps == [0.11, 0.22, 0.11, 0.22]
+
+
 def test_open_serial_exception_raises_transport_open_error(monkeypatch):
     def bad_ctor(*a, **k):
         raise usb_mod.SerialException("no port")
@@ -112,27 +154,27 @@ def test_read_write_flush_not_open_raise():
         t.flush()
 
 
-def test_read_collects_until_n_or_timeout(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
-    s._read_chunks = [b"\x01", b"\x02\x03", b""]  # timeout
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
+def test_read_returns_single_chunk_on_timeout(opened_usb):
+    t, s = opened_usb
+    s._read_chunks = [b"\x01", b"\x02\x03", b""]  # short read = timeout
 
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
+    assert t.read(5) == b"\x01"  # one serial read per call, 0..n bytes
+    assert s._read_chunks == [b"\x02\x03", b""]
 
-    out = t.read(5)
-    assert out == b"\x01\x02\x03"
 
+def test_read_requests_n_as_given(opened_usb):
+    t, s = opened_usb
+    s.in_waiting = 2  # sizing is the caller's job; read() does not re-query
+    requested = []
+    s.read = lambda n: requested.append(n) or b"\x01\x02"
 
-def test_read_serial_exception_clears_ser_and_raises(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
-    s._raise_on_read = usb_mod.SerialException("read fail")
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
+    assert t.read(256) == b"\x01\x02"
+    assert requested == [256]
 
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
+
+def test_read_serial_exception_clears_ser_and_raises(opened_usb):
+    t, s = opened_usb
+    s._raise_on_read = usb_mod.SerialException("read fail")
 
     with pytest.raises(TransportIOError):
         t.read(1)
@@ -140,26 +182,16 @@ def test_read_serial_exception_clears_ser_and_raises(monkeypatch):
     assert t.ser is None
 
 
-def test_write_returns_bytes_written(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
+def test_write_returns_bytes_written(opened_usb):
+    t, s = opened_usb
     s._write_ret = 3
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
-
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
 
     assert t.write(b"abc") == 3
 
 
-def test_write_serial_exception_clears_ser_and_raises(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
+def test_write_serial_exception_clears_ser_and_raises(opened_usb):
+    t, s = opened_usb
     s._raise_on_write = usb_mod.SerialException("write fail")
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
-
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
 
     with pytest.raises(TransportIOError):
         t.write(b"x")
@@ -167,26 +199,16 @@ def test_write_serial_exception_clears_ser_and_raises(monkeypatch):
     assert t.ser is None
 
 
-def test_flush_calls_underlying_flush(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
-
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
+def test_flush_calls_underlying_flush(opened_usb):
+    t, s = opened_usb
 
     t.flush()
     assert s.flush_called == 1
 
 
-def test_flush_serial_exception_clears_ser_and_raises(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
+def test_flush_serial_exception_clears_ser_and_raises(opened_usb):
+    t, s = opened_usb
     s._raise_on_flush = usb_mod.SerialException("flush fail")
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
-
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
 
     with pytest.raises(TransportIOError):
         t.flush()
@@ -194,13 +216,8 @@ def test_flush_serial_exception_clears_ser_and_raises(monkeypatch):
     assert t.ser is None
 
 
-def test_close_closes_and_clears(monkeypatch):
-    s = FakeSerial("COM1", 115200, 1.0, 1.0)
-    monkeypatch.setattr(usb_mod.serial, "Serial", lambda *a, **k: s)
-    monkeypatch.setattr(usb_mod.time, "sleep", lambda _t: None)
-
-    t = usb_mod.USBTransport("COM1", assert_dtr=False)
-    t.open()
+def test_close_closes_and_clears(opened_usb):
+    t, s = opened_usb
     t.close()
 
     assert s.close_called == 1
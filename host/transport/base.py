@@ -3,6 +3,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any
 
+from .errors import TransportIOError
+
 
 class Transport(ABC):
     """
@@ -13,7 +15,9 @@ class Transport(ABC):
       - read(n) returns 0..n bytes. It may return fewer than n bytes due to timeouts
         or non-blocking behavior, and may return b"" when no data is available.
       - write(data) returns the number of bytes written.
+      - write_all(data) writes every byte, retrying short writes.
       - flush() forces pending output to be transmitted.
+      - bytes_available() reports bytes readable without blocking (0 if unknown).
     """
 
     @abstractmethod
@@ -31,6 +35,23 @@ class Transport(ABC):
     @abstractmethod
     def flush(self) -> None: ...
 
+    def write_all(self, data: bytes) -> int:
+        total = len(data)
+        sent = self.write(data)
+        if sent >= total:
+            return total
+
+        mv = memoryview(data)  # resend the tail without copying it
+        while sent < total:
+            n = self.write(mv[sent:])
+            if not n:
+                raise TransportIOError(f"write stalled after {sent}/{total} bytes")
+            sent += n
+        return total
+
+    def bytes_available(self) -> int:
+        return 0
+
     def __enter__(self) -> "Transport":
         self.open()
         return self
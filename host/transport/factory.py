@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Mapping
+from types import MappingProxyType
+from typing import Any, Optional, Mapping
 
 from host.model.transport import TransportType
 from host.transport.base import Transport as HwTransport
@@ -11,11 +12,13 @@ from host.transport.params import TransportParamResolver
 from host.transport.errors import TransportError
 from host.core.errors import TransportConfigError
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
 
 @dataclass(frozen=True)
 class DeviceTransport:
     transport: HwTransport
-    params: Dict[str, Any]
+    params: Mapping[str, Any]  # read-only view of the resolved kwargs
     meta: TransportType
 
 
@@ -31,14 +34,15 @@ class TransportFactory:
         drivers: TransportDriverRegistry,
     ):
         self._transports = transports
+        self._transports_view: Mapping[int, TransportType] = MappingProxyType(transports)
         self._drivers = drivers
         self._params = TransportParamResolver(transports)
 
     def transports(self) -> Mapping[int, TransportType]:
-        return dict(self._transports)
+        return self._transports_view
 
-    def create(self, type_id: int, overrides: Optional[Dict[str, Any]] = None) -> DeviceTransport:
-        overrides = overrides or {}
+    def create(self, type_id: int, overrides: Optional[Mapping[str, Any]] = None) -> DeviceTransport:
+        overrides = overrides if overrides else _EMPTY
         meta = self._transports.get(int(type_id))
         if not meta:
             raise TransportConfigError(
@@ -50,7 +54,7 @@ class TransportFactory:
         try:
             params = self._params.resolve(type_id, overrides)
             hw = self._drivers.create(meta.driver, **params)
-            return DeviceTransport(transport=hw, params=params, meta=meta)
+            return DeviceTransport(transport=hw, params=MappingProxyType(params), meta=meta)
 
         except TransportConfigError:
             raise
@@ -1,22 +1,36 @@
 # host/transport/params.py
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Mapping
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Mapping, Tuple
 
 from host.model.transport import TransportType
 from host.core.errors import TransportConfigError
 
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Resolved override sets kept per resolver; least recently used evicted first
+_RESOLVED_MAX = 128
+
 
 class TransportParamResolver:
     """
     Resolve concrete transport kwargs from a TransportType param schema + overrides.
+
+    Resolution is deterministic per (type_id, overrides), so successful results
+    are memoized (LRU, up to _RESOLVED_MAX entries); callers always receive a
+    fresh dict.
     """
 
     def __init__(self, transports: Mapping[int, TransportType]):
         self._transports = transports
+        self._resolved: "OrderedDict[Tuple[int, Tuple[Any, ...]], Dict[str, Any]]" = OrderedDict()
+        # type_id -> ((name, has_default, default, required, type_name), ...)
+        self._schemas: Dict[int, Tuple[Tuple[str, bool, Any, bool, Any], ...]] = {}
 
-    def resolve(self, type_id: int, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        overrides = overrides or {}
+    def resolve(self, type_id: int, overrides: Optional[Mapping[str, Any]] = None) -> Dict[str, Any]:
+        overrides = overrides if overrides else _EMPTY
         meta = self._transports.get(int(type_id))
         if not meta:
             raise TransportConfigError(
@@ -25,9 +39,44 @@ class TransportParamResolver:
                 details={"type_id": int(type_id)},
             ) from None
 
-        return self._resolve_from_meta(meta, overrides)
+        try:
+            # value types are part of the key: True == 1 == 1.0 cast differently
+            key = (int(type_id), tuple(sorted((k, type(v), v) for k, v in overrides.items())))
+            hash(key)
+        except TypeError:
+            key = None  # unhashable override values: resolve uncached
+
+        if key is not None:
+            cached = self._resolved.get(key)
+            if cached is not None:
+                self._resolved.move_to_end(key)
+                return dict(cached)
+
+        resolved = self._resolve_from_meta(meta, overrides)
+        if key is not None:
+            self._resolved[key] = resolved
+            if len(self._resolved) > _RESOLVED_MAX:
+                self._resolved.popitem(last=False)
+            return dict(resolved)
+        return resolved
 
-    def _resolve_from_meta(self, meta: TransportType, overrides: Dict[str, Any]) -> Dict[str, Any]:
+    def _schema(self, meta: TransportType) -> Tuple[Tuple[str, bool, Any, bool, Any], ...]:
+        schema = self._schemas.get(meta.type_id)
+        if schema is None:
+            schema = tuple(
+                (
+                    name,
+                    "default" in spec,
+                    spec.get("default"),
+                    bool(spec.get("required", False)),
+                    spec.get("type"),
+                )
+                for name, spec in meta.params.items()
+            )
+            self._schemas[meta.type_id] = schema
+        return schema
+
+    def _resolve_from_meta(self, meta: TransportType, overrides: Mapping[str, Any]) -> Dict[str, Any]:
         resolved: Dict[str, Any] = {}
 
         # Validate override keys
@@ -39,12 +88,12 @@ class TransportParamResolver:
                     details={"label": meta.label, "driver": meta.driver, "param": key},
                 ) from None
 
-        for name, spec in meta.params.items():
+        for name, has_default, default, required, type_name in self._schema(meta):
             if name in overrides:
                 value = overrides[name]
-            elif "default" in spec:
-                value = spec["default"]
-            elif spec.get("required", False):
+            elif has_default:
+                value = default
+            elif required:
                 raise TransportConfigError(
                     f"Missing required transport param '{name}' for transport '{meta.label}'.",
                     hint="Provide it as a CLI flag / config override.",
@@ -54,7 +103,7 @@ class TransportParamResolver:
                 continue
 
             try:
-                resolved[name] = self._cast_param(value, spec.get("type"))
+                resolved[name] = self._cast_param(value, type_name)
             except (TypeError, ValueError) as e:
                 raise TransportConfigError(
                     f"Invalid value for transport '{meta.label}' param '{name}'.",
@@ -64,7 +113,7 @@ class TransportParamResolver:
                         "driver": meta.driver,
                         "param": name,
                         "value": value,
-                        "expected_type": spec.get("type"),
+                        "expected_type": type_name,
                     },
                 ) from None
 
@@ -75,28 +124,44 @@ class TransportParamResolver:
         if value is None:
             return None
 
-        if type_name == "str":
-            if not isinstance(value, str):
-                raise TypeError(f"Expected str, got {type(value).__name__}")
-            return value
-
-        if type_name == "int":
-            if isinstance(value, bool) or not isinstance(value, int):
-                raise TypeError(f"Expected int, got {type(value).__name__}")
-            return value
-
-        if type_name == "float":
-            if isinstance(value, bool) or not isinstance(value, (int, float)):
-                raise TypeError(f"Expected float, got {type(value).__name__}")
-            return float(value)
-
-        if type_name == "bool":
-            if isinstance(value, bool):
-                return value
-            # accept 0/1 int
-            if isinstance(value, int) and value in (0, 1):
-                return bool(value)
-            raise TypeError(f"Expected bool (or 0/1), got {type(value).__name__}")
-
-        # unknown schema type
-        raise TypeError(f"Unknown schema type '{type_name}'")
+        caster = _CASTERS.get(type_name)
+        if caster is None:
+            # unknown schema type
+            raise TypeError(f"Unknown schema type '{type_name}'")
+        return caster(value)
+
+
+def _cast_str(value: Any) -> str:
+    if not isinstance(value, str):
+        raise TypeError(f"Expected str, got {type(value).__name__}")
+    return value
+
+
+def _cast_int(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"Expected int, got {type(value).__name__}")
+    return value
+
+
+def _cast_float(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise TypeError(f"Expected float, got {type(value).__name__}")
+    return float(value)
+
+
+def _cast_bool(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    # accept 0/1 int
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    raise TypeError(f"Expected bool (or 0/1), got {type(value).__name__}")
+
+
+# schema type name -> validating cast
+_CASTERS: Dict[str, Callable[[Any], Any]] = {
+    "str": _cast_str,
+    "int": _cast_int,
+    "float": _cast_float,
+    "bool": _cast_bool,
+}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import Dict, Type
 
 from .base import Transport
@@ -19,8 +20,11 @@ class TransportDriverRegistry:
     """
 
     def __init__(self, drivers: Dict[str, Type[Transport]]):
-        # normalize keys to be case-insensitive
-        self._drivers: Dict[str, Type[Transport]] = {k.lower(): v for k, v in drivers.items()}
+        # normalize keys to be case-insensitive; interned so already-lowercase
+        # lookups (metadata driver names) hit without allocating
+        self._drivers: Dict[str, Type[Transport]] = {
+            sys.intern(k.lower()): v for k, v in drivers.items()
+        }
 
     @classmethod
     def default(cls) -> "TransportDriverRegistry":
@@ -33,13 +37,15 @@ class TransportDriverRegistry:
         )
 
     def has(self, driver: str) -> bool:
-        return driver.lower() in self._drivers
+        return driver in self._drivers or driver.lower() in self._drivers
 
     def get_class(self, driver: str) -> Type[Transport]:
-        key = driver.lower()
-        if key not in self._drivers:
+        transport_cls = self._drivers.get(driver)
+        if transport_cls is None:
+            transport_cls = self._drivers.get(driver.lower())
+        if transport_cls is None:
             raise TransportError(f"Transport driver '{driver}' not registered")
-        return self._drivers[key]
+        return transport_cls
 
     def create(self, driver: str, **params) -> Transport:
         """
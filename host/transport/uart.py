@@ -1,6 +1,9 @@
 # host/transport/uart.py
 from __future__ import annotations
 
+import os
+import sys
+import time
 from typing import Optional
 
 import serial
@@ -10,17 +13,46 @@ from .base import Transport
 from .errors import TransportIOError, TransportOpenError
 
 
+def _try_lower_latency_timer(port: str) -> None:
+    """
+    Best-effort: set a Linux USB-serial bridge's latency_timer to 1 ms.
+
+    FTDI-style bridges batch input for 16 ms by default, which shows up as
+    bursty reads. Ports without the sysfs knob or without write permission
+    are left as they are.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    name = os.path.basename(os.path.realpath(port))
+    try:
+        with open(f"/sys/bus/usb-serial/devices/{name}/latency_timer", "wb") as f:
+            f.write(b"1")
+    except OSError:
+        pass
+
+
 class UARTTransport(Transport):
     """
     UART transport implemented via pyserial.
 
     read(n) attempts to read up to n bytes and may return fewer due to timeout.
+    A short read keeps collecting only until the read deadline (timeout seconds
+    after the call) has passed, so a slow trickle cannot stretch it to n * timeout.
     """
 
-    def __init__(self, port: str, baudrate: int = 115200, timeout: float = 0.05):
+    def __init__(
+        self,
+        port: str,
+        baudrate: int = 115200,
+        timeout: float = 0.05,
+        low_latency: bool = True,
+        flush_on_open: bool = True,
+    ):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.low_latency = low_latency
+        self.flush_on_open = flush_on_open
         self.ser: Optional[serial.Serial] = None
 
     def open(self) -> None:
@@ -31,8 +63,11 @@ class UARTTransport(Transport):
                 timeout=self.timeout,
                 write_timeout=self.timeout,
             )
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
+            if self.flush_on_open:
+                self.ser.reset_input_buffer()
+                self.ser.reset_output_buffer()
+            if self.low_latency:
+                _try_lower_latency_timer(self.port)
         except SerialException as e:
             self.ser = None
             raise TransportOpenError(str(e)) from None
@@ -48,22 +83,39 @@ class UARTTransport(Transport):
         return self.ser is not None and self.ser.is_open
 
     def read(self, n: int) -> bytes:
-        if self.ser is None:
+        ser = self.ser  # one snapshot: close() may clear self.ser concurrently
+        if ser is None:
             raise TransportIOError("read while transport not open")
 
         try:
-            buf = b""
-            while len(buf) < n:
-                chunk = self.ser.read(n - len(buf))
+            ser_read = ser.read
+            deadline = time.monotonic() + self.timeout
+            chunk = ser_read(n)
+            if not chunk or len(chunk) >= n:
+                return chunk  # common case: one call, no copy
+
+            buf = bytearray(chunk)
+            while len(buf) < n and time.monotonic() < deadline:
+                chunk = ser_read(n - len(buf))
                 if not chunk:
                     # timeout reached → return whatever is collected
                     break
                 buf += chunk
-            return buf
+            return bytes(buf)
         except SerialException as e:
             self.ser = None
             raise TransportIOError(f"UART read failed: {e}") from None
 
+    def bytes_available(self) -> int:
+        if self.ser is None:
+            raise TransportIOError("bytes_available while transport not open")
+
+        try:
+            return self.ser.in_waiting
+        except SerialException as e:
+            self.ser = None
+            raise TransportIOError(f"UART in_waiting failed: {e}") from None
+
     def write(self, data: bytes) -> int:
         if self.ser is None:
             raise TransportIOError("write while transport not open")
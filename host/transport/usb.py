@@ -18,6 +18,8 @@ class USBTransport(Transport):
     Notes:
       - Uses the Transport.read(n) contract: returns 0..n bytes.
       - Optionally toggles DTR/RTS on open to reset some MCU CDC implementations.
+      - Without a DTR/RTS pulse, the settle delay is only waited on the first
+        open; reopening the same port after close() does not reset the device.
     """
 
     def __init__(
@@ -29,6 +31,7 @@ class USBTransport(Transport):
         baudrate: int = 115200,
         reset_delay_s: float = 0.1,
         post_reset_delay_s: float = 0.5,
+        flush_on_open: bool = True,
     ):
         self.port = port
         self.read_timeout = read_timeout
@@ -37,7 +40,9 @@ class USBTransport(Transport):
         self.baudrate = baudrate
         self.reset_delay_s = reset_delay_s
         self.post_reset_delay_s = post_reset_delay_s
+        self.flush_on_open = flush_on_open
         self.ser: Optional[serial.Serial] = None
+        self._opened_before = False
 
     def open(self) -> None:
         if self.ser is not None:
@@ -76,8 +81,9 @@ class USBTransport(Transport):
             ) from None
 
         try:
-            self.ser.reset_input_buffer()
-            self.ser.reset_output_buffer()
+            if self.flush_on_open:
+                self.ser.reset_input_buffer()
+                self.ser.reset_output_buffer()
 
             if self.assert_dtr:
                 self.ser.dtr = False
@@ -85,10 +91,12 @@ class USBTransport(Transport):
                 time.sleep(self.reset_delay_s)
                 self.ser.dtr = True
                 self.ser.rts = True
-                time.sleep(self.post_reset_delay_s)
+                time.sleep(self.post_reset_delay_s)  # board may be rebooting
             else:
                 self.ser.dtr = True
-                time.sleep(self.post_reset_delay_s)
+                if not self._opened_before:
+                    time.sleep(self.post_reset_delay_s)
+            self._opened_before = True
 
         except SerialException as e:
             self.ser = None
@@ -104,15 +112,26 @@ class USBTransport(Transport):
                 self.ser = None
 
     def read(self, n: int) -> bytes:
-        if self.ser is None:
+        ser = self.ser  # one snapshot: close() may clear self.ser concurrently
+        if ser is None:
             raise TransportIOError("read while transport not open")
 
         try:
-            return self.ser.read(n)
+            return ser.read(n)
         except SerialException as e:
             self.ser = None
             raise TransportIOError(f"USB read failed: {e}") from None
 
+    def bytes_available(self) -> int:
+        if self.ser is None:
+            raise TransportIOError("bytes_available while transport not open")
+
+        try:
+            return self.ser.in_waiting
+        except SerialException as e:
+            self.ser = None
+            raise TransportIOError(f"USB in_waiting failed: {e}") from None
+
     def write(self, data: bytes) -> int:
         if self.ser is None:
             raise TransportIOError("write while transport not open")